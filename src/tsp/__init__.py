@@ -1,14 +1,54 @@
 import argparse
+import random
 import sys
 import time
 
-from tsp.algorithms.constructive import cheapest_insertion, nearest_neighbor, three_opt, two_opt
-from tsp.io.csv_reader import read_asymetric_matrix
+from tsp.algorithms.constructive import (
+    cheapest_insertion,
+    farthest_insertion,
+    greedy_edge,
+    nearest_insertion,
+    nearest_neighbor,
+    three_opt,
+    two_opt,
+)
+from tsp.algorithms.decomposition import decompose
+from tsp.algorithms.evolutionary import island_model
+from tsp.algorithms.local_search import ACCEPT_CRITERIA, iterated_local_search
+from tsp.algorithms.sparse import sparse_nearest_neighbor, sparse_two_opt
+from tsp.algorithms.symmetric import three_opt_symmetric, two_opt_symmetric
+from tsp.io.checkpoint import DEFAULT_INTERVAL, Checkpointer, graph_hash, read_checkpoint
+from tsp.io.csv_reader import read_asymetric_matrix, read_points, read_sparse_matrix
+from tsp.models.symmetric_graph import DEFAULT_SYMMETRIC_TOL, SymmetricGraph
+
+# pipeline steps that can be resumed from a checkpoint, in order
+PHASES = ["construct", "two_opt", "three_opt", "ils", "evolve"]
 
 
 def main() -> None:
     parser = argparse.ArgumentParser(description="Solve TSP using constructive algorithms")
     parser.add_argument("csv_file", help="Path to the CSV file containing the cost matrix")
+    parser.add_argument(
+        "--points",
+        action="store_true",
+        help="Read csv_file as node coordinates (label,x,y) and compute costs lazily"
+    )
+    parser.add_argument(
+        "--sparse",
+        action="store_true",
+        help="Store only finite arcs and use sparse-aware nearest neighbor and 2-opt"
+    )
+    parser.add_argument(
+        "--symmetric-tol",
+        type=float,
+        default=DEFAULT_SYMMETRIC_TOL,
+        help=f"Tolerance for detecting symmetric matrices (default: {DEFAULT_SYMMETRIC_TOL})"
+    )
+    parser.add_argument(
+        "--no-symmetric",
+        action="store_true",
+        help="Disable symmetric matrix detection"
+    )
     parser.add_argument(
         "--start",
         type=int,
@@ -17,10 +57,28 @@ def main() -> None:
     )
     parser.add_argument(
         "--algorithm",
-        choices=["nearest_neighbor", "cheapest_insertion"],
+        choices=["nearest_neighbor", "cheapest_insertion", "greedy_edge", "nearest_insertion", "farthest_insertion"],
         default="nearest_neighbor",
         help="Algorithm to use (default: nearest_neighbor)"
     )
+    parser.add_argument(
+        "--decompose-time-limit",
+        type=float,
+        default=None,
+        help="Re-optimize windows of the initial tour in parallel for S seconds (default: off)"
+    )
+    parser.add_argument(
+        "--window",
+        type=int,
+        default=200,
+        help="Number of nodes per window for --decompose-time-limit (default: 200)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of worker processes for --decompose-time-limit (default: one per CPU)"
+    )
     parser.add_argument(
         "--two-opt",
         action="store_true",
@@ -55,6 +113,52 @@ def main() -> None:
         default=None,
         help="Timeout in seconds for 3-opt (default: no limit)"
     )
+    parser.add_argument(
+        "--ils-time-limit",
+        type=float,
+        default=None,
+        help="Run iterated local search for S seconds after the other improvements (default: off)"
+    )
+    parser.add_argument(
+        "--ils-accept",
+        choices=list(ACCEPT_CRITERIA),
+        default="better",
+        help="Acceptance criterion for iterated local search (default: better)"
+    )
+    parser.add_argument(
+        "--evolve-time-limit",
+        type=float,
+        default=None,
+        help="Run the parallel island-model evolutionary solver for S seconds (default: off)"
+    )
+    parser.add_argument(
+        "--islands",
+        type=int,
+        default=None,
+        help="Number of island processes for the evolutionary solver (default: one per CPU)"
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=None,
+        help="Random seed for iterated local search, decomposition and the evolutionary solver (default: random)"
+    )
+    parser.add_argument(
+        "--checkpoint",
+        default=None,
+        help="Periodically save the current tour, cost, phase and RNG state to this file (default: off)"
+    )
+    parser.add_argument(
+        "--checkpoint-interval",
+        type=float,
+        default=DEFAULT_INTERVAL,
+        help=f"Minimum seconds between checkpoint writes (default: {DEFAULT_INTERVAL})"
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue from the --checkpoint file instead of constructing a new tour"
+    )
     parser.add_argument(
         "--benchmark",
         action="store_true",
@@ -69,15 +173,117 @@ def main() -> None:
     args = parser.parse_args()
 
     try:
-        graph = read_asymetric_matrix(args.csv_file)
-        algos = {"nearest_neighbor": nearest_neighbor, "cheapest_insertion": cheapest_insertion}
+        symmetric_tol = None if args.no_symmetric else args.symmetric_tol
+        if args.points:
+            graph = read_points(args.csv_file)
+            load_mode = "points"
+        elif args.sparse:
+            graph = read_sparse_matrix(args.csv_file)
+            load_mode = "sparse"
+        else:
+            graph = read_asymetric_matrix(args.csv_file, symmetric_tol=symmetric_tol)
+            load_mode = f"matrix symmetric_tol={symmetric_tol}"
+        algos = {
+            "nearest_neighbor": nearest_neighbor,
+            "cheapest_insertion": cheapest_insertion,
+            "greedy_edge": greedy_edge,
+            "nearest_insertion": nearest_insertion,
+            "farthest_insertion": farthest_insertion,
+        }
+        improve_two_opt = two_opt
+        improve_three_opt = three_opt
+        if isinstance(graph, SymmetricGraph):
+            improve_two_opt = two_opt_symmetric
+            improve_three_opt = three_opt_symmetric
+        if args.sparse:
+            algos["nearest_neighbor"] = sparse_nearest_neighbor
+            improve_two_opt = sparse_two_opt
+
+        def report_progress(elapsed, best_cost):
+            print(f"Best cost after {elapsed:.2f}s: {best_cost}")
+
+        matrix_hash = None
+        resume = None
+        if args.checkpoint is not None:
+            matrix_hash = graph_hash(graph, load_mode)
+            if args.resume:
+                resume = read_checkpoint(args.checkpoint)
+                if resume.matrix_hash != matrix_hash:
+                    raise ValueError("checkpoint was written for a different input matrix")
+                if resume.phase not in PHASES or sorted(resume.tour) != list(range(graph.n)):
+                    raise ValueError("checkpoint does not hold a valid tour for this matrix")
+        elif args.resume:
+            raise ValueError("--resume requires --checkpoint")
 
         def get_tour_cost(start):
-            tour, cost = algos[args.algorithm](graph, start)
-            if args.two_opt:
-                tour, cost = two_opt(graph, tour, max_passes=args.two_opt_max_passes, timeout=args.two_opt_timeout)
-            if args.three_opt:
-                tour, cost = three_opt(graph, tour, max_passes=args.three_opt_max_passes, timeout=args.three_opt_timeout)
+            rng = random.Random(args.seed)
+            checkpointer = None
+            if args.checkpoint is not None:
+                checkpointer = Checkpointer(args.checkpoint, graph, matrix_hash, args.checkpoint_interval, rng)
+
+            def start_phase(phase):
+                # phases before the resumed one are already done
+                if resume is not None and PHASES.index(phase) < PHASES.index(resume.phase):
+                    return False
+                if checkpointer is not None:
+                    checkpointer.phase = phase
+                return True
+
+            def end_phase(tour):
+                if checkpointer is not None:
+                    checkpointer.write(tour)
+
+            if resume is None:
+                start_phase("construct")
+                tour, cost = algos[args.algorithm](graph, start)
+                if args.decompose_time_limit is not None:
+                    tour, cost = decompose(
+                        graph,
+                        tour,
+                        args.decompose_time_limit,
+                        window=args.window,
+                        workers=args.workers,
+                        seed=args.seed,
+                        progress=None if args.benchmark else report_progress,
+                    )
+                end_phase(tour)
+            else:
+                tour, cost = list(resume.tour), resume.cost
+                if resume.rng_state is not None:
+                    rng.setstate(resume.rng_state)
+            if args.two_opt and start_phase("two_opt"):
+                tour, cost = improve_two_opt(
+                    graph,
+                    tour,
+                    max_passes=args.two_opt_max_passes,
+                    timeout=args.two_opt_timeout,
+                    on_improvement=checkpointer,
+                )
+                end_phase(tour)
+            if args.three_opt and start_phase("three_opt"):
+                tour, cost = improve_three_opt(
+                    graph,
+                    tour,
+                    max_passes=args.three_opt_max_passes,
+                    timeout=args.three_opt_timeout,
+                    on_improvement=checkpointer,
+                )
+                end_phase(tour)
+            if args.ils_time_limit is not None and start_phase("ils"):
+                tour, cost = iterated_local_search(
+                    graph, tour, args.ils_time_limit, accept=args.ils_accept, rng=rng, on_improvement=checkpointer
+                )
+                end_phase(tour)
+            if args.evolve_time_limit is not None and start_phase("evolve"):
+                tour, cost = island_model(
+                    graph,
+                    tour,
+                    args.evolve_time_limit,
+                    islands=args.islands,
+                    seed=args.seed,
+                    progress=None if args.benchmark else report_progress,
+                )
+                end_phase(tour)
             return tour, cost
 
         if args.benchmark:
@@ -89,7 +295,18 @@ def main() -> None:
                 end_time = time.time()
                 costs.append(cost)
                 times.append(end_time - start_time)
-            algo_name = f"{args.algorithm}{' + 2-opt' if args.two_opt else ''}{' + 3-opt' if args.three_opt else ''}"
+            steps = [args.algorithm]
+            if args.decompose_time_limit is not None:
+                steps.append("decomposition")
+            if args.two_opt:
+                steps.append("2-opt")
+            if args.three_opt:
+                steps.append("3-opt")
+            if args.ils_time_limit is not None:
+                steps.append("ILS")
+            if args.evolve_time_limit is not None:
+                steps.append("EA")
+            algo_name = " + ".join(steps)
             print(f"Algorithm: {algo_name}")
             print(f"Runs: {args.runs}")
             print(f"Cost - Min: {min(costs):.2f}, Max: {max(costs):.2f}, Avg: {sum(costs)/len(costs):.2f}")
@@ -1,8 +1,13 @@
+import heapq
+import math
 import time
-from typing import Optional
+from typing import Callable, Iterator, Optional
 
 from tsp.models.graph import AsymmetricGraph
 
+# deltas above this are treated as no improvement (float noise)
+_EPS = 1e-9
+
 
 def _tour_cost(graph: AsymmetricGraph, tour: list[int]) -> float:
     n = len(tour)
@@ -27,9 +32,10 @@ def nearest_neighbor(
 
     while len(tour) < n:
         # choose nearest unvisited (deterministic tie-break by index)
+        row = graph.row(current)
         next_city = min(
             (j for j in range(n) if not visited[j]),
-            key=lambda j: (graph.c(current, j), j),
+            key=lambda j: (row[j], j),
         )
         tour.append(next_city)
         visited[next_city] = True
@@ -91,12 +97,169 @@ def cheapest_insertion(
     return cycle, _tour_cost(graph, cycle)
 
 
-def two_opt(graph: AsymmetricGraph, tour: list[int], max_passes: int = 100, timeout: float | None = None) -> tuple[list[int], float]:
+def _finite_arcs(graph: AsymmetricGraph, i: int) -> Iterator[tuple[int, float]]:
+    # (j, cost) of the finite arcs leaving i, without building a dense row
+    # when the graph stores its arcs sparsely
+    if hasattr(graph, "out_arcs"):
+        return zip(*graph.out_arcs(i))
+    return ((j, cost) for j, cost in enumerate(graph.row(i)) if cost != math.inf)
+
+
+def greedy_edge(
+    graph: AsymmetricGraph, start: int = 0
+) -> tuple[list[int], float]:
+    """
+    Constructs a tour using the greedy edge algorithm
+    returns a tuple (tour, cost)
+    Finite arcs are sorted once and added cheapest first when they keep every
+    node at in/out degree <= 1 and close no subtour (checked with a union-find).
+    The resulting paths are then chained, cheapest next head first.
+    """
+    n = graph.n
+    if not (0 <= start < n):
+        raise IndexError("start must be a valid node index")
+
+    if n == 1:
+        return [start], 0.0
+
+    arcs = sorted((cost, i, j) for i in range(n) for j, cost in _finite_arcs(graph, i))
+
+    succ = [-1] * n
+    pred = [-1] * n
+    parent = list(range(n))
+
+    def find(x: int) -> int:
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    added = 0
+    for _, i, j in arcs:
+        if succ[i] != -1 or pred[j] != -1:
+            continue
+        ri, rj = find(i), find(j)
+        if ri == rj:
+            continue
+        succ[i] = j
+        pred[j] = i
+        parent[ri] = rj
+        added += 1
+        if added == n - 1:
+            break
+
+    # chain the fragments, starting with the one that contains start
+    head = start
+    while pred[head] != -1:
+        head = pred[head]
+    heads = {v for v in range(n) if pred[v] == -1 and v != head}
+
+    tour: list[int] = []
+    while True:
+        node = head
+        while node != -1:
+            tour.append(node)
+            node = succ[node]
+        if not heads:
+            break
+        out = dict(_finite_arcs(graph, tour[-1]))
+        head = min(heads, key=lambda v: (out.get(v, math.inf), v))
+        heads.remove(head)
+
+    idx = tour.index(start)
+    tour = tour[idx:] + tour[:idx]
+    return tour, _tour_cost(graph, tour)
+
+
+def _insertion(
+    graph: AsymmetricGraph, start: int, farthest: bool
+) -> tuple[list[int], float]:
+    n = graph.n
+    if not (0 <= start < n):
+        raise IndexError("start must be a valid node index")
+
+    if n == 1:
+        return [start], 0.0
+
+    sign = -1 if farthest else 1
+    in_tour = [False] * n
+    in_tour[start] = True
+
+    # dist[k]: cheapest arc in either direction between k and the tour
+    row = graph.row(start)
+    dist = [min(row[k], graph.c(k, start)) for k in range(n)]
+    heap = [(sign * dist[k], k) for k in range(n) if k != start]
+    heapq.heapify(heap)
+
+    cycle: list[int] = [start]
+    while heap:
+        key, k = heapq.heappop(heap)
+        if in_tour[k] or key != sign * dist[k]:
+            # stale entry, dist[k] changed since it was pushed
+            continue
+
+        m = len(cycle)
+        row_k = graph.row(k)
+        best_pos = 1
+        best_delta = None
+        for i in range(m):
+            a = cycle[i]
+            b = cycle[(i + 1) % m]
+            delta = graph.c(a, k) + row_k[b] - (graph.c(a, b) if m > 1 else 0.0)
+            if best_delta is None or delta < best_delta:
+                best_delta = delta
+                best_pos = i + 1
+        cycle.insert(best_pos, k)
+        in_tour[k] = True
+
+        for j in range(n):
+            if in_tour[j]:
+                continue
+            d = min(row_k[j], graph.c(j, k))
+            if d < dist[j]:
+                dist[j] = d
+                heapq.heappush(heap, (sign * d, j))
+
+    return cycle, _tour_cost(graph, cycle)
+
+
+def nearest_insertion(
+    graph: AsymmetricGraph, start: int = 0
+) -> tuple[list[int], float]:
+    """
+    Constructs a tour using the nearest insertion algorithm
+    returns a tuple (tour, cost)
+    The node closest to the tour is selected from a heap and inserted at its
+    cheapest position.
+    """
+    return _insertion(graph, start, farthest=False)
+
+
+def farthest_insertion(
+    graph: AsymmetricGraph, start: int = 0
+) -> tuple[list[int], float]:
+    """
+    Constructs a tour using the farthest insertion algorithm
+    returns a tuple (tour, cost)
+    The node farthest from the tour is selected from a heap and inserted at its
+    cheapest position.
+    """
+    return _insertion(graph, start, farthest=True)
+
+
+def two_opt(
+    graph: AsymmetricGraph,
+    tour: list[int],
+    max_passes: int = 100,
+    timeout: float | None = None,
+    on_improvement: Optional[Callable[[list[int]], None]] = None,
+) -> tuple[list[int], float]:
     """
     Improves a tour using the 2-opt algorithm
     returns a tuple (tour, cost)
     max_passes: maximum number of improvement passes to prevent infinite loops
     timeout: maximum time in seconds to run (None for no limit)
+    on_improvement: called with the tour after every improving move
     """
     n = len(tour)
     if n < 4:
@@ -124,17 +287,26 @@ def two_opt(graph: AsymmetricGraph, tour: list[int], max_passes: int = 100, time
                     improved = True
                     break
             if improved:
+                if on_improvement is not None:
+                    on_improvement(tour)
                 break
 
     return tour, _tour_cost(graph, tour)
 
 
-def three_opt(graph: AsymmetricGraph, tour: list[int], max_passes: int = 100, timeout: float | None = None) -> tuple[list[int], float]:
+def three_opt(
+    graph: AsymmetricGraph,
+    tour: list[int],
+    max_passes: int = 100,
+    timeout: float | None = None,
+    on_improvement: Optional[Callable[[list[int]], None]] = None,
+) -> tuple[list[int], float]:
     """
     Improves a tour using the 3-opt algorithm
     returns a tuple (tour, cost)
     max_passes: maximum number of improvement passes to prevent infinite loops
     timeout: maximum time in seconds to run (None for no limit)
+    on_improvement: called with the tour after every improving move
     """
     n = len(tour)
     if n < 6:
@@ -189,6 +361,8 @@ def three_opt(graph: AsymmetricGraph, tour: list[int], max_passes: int = 100, ti
                 if improved:
                     break
             if improved:
+                if on_improvement is not None:
+                    on_improvement(tour)
                 break
 
     return tour, _tour_cost(graph, tour)
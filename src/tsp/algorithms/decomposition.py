@@ -0,0 +1,122 @@
+import multiprocessing
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+from tsp.algorithms.constructive import _tour_cost, greedy_edge
+from tsp.algorithms.evolutionary import Progress
+from tsp.algorithms.local_search import iterated_local_search
+from tsp.models.graph import AsymmetricGraph
+from tsp.models.shared_graph import to_shared
+from tsp.models.sub_graph import SubGraph
+
+# graph attached once per worker process by _init_worker
+_worker_graph: Optional[AsymmetricGraph] = None
+
+
+def _init_worker(graph: AsymmetricGraph) -> None:
+    global _worker_graph
+    _worker_graph = graph
+
+
+def solve_path(
+    graph: AsymmetricGraph, nodes: list[int], time_limit: float, rng: random.Random
+) -> list[int]:
+    """
+    Reorders the inner nodes of the path nodes[0] -> ... -> nodes[-1], keeping both ends
+    returns the new node order, never worse than the given one
+    The path is solved as a tour of a SubGraph view, starting from the better of
+    the given order and greedy_edge, then improved with iterated local search.
+    """
+    m = len(nodes)
+    if m < 4:
+        return nodes
+
+    start_time = time.time()
+    sub = SubGraph(graph, nodes, path=True)
+    tour, cost = list(range(m)), _tour_cost(sub, list(range(m)))
+    greedy_tour, greedy_cost = greedy_edge(sub, 0)
+    if greedy_cost < cost:
+        tour = greedy_tour
+    # the construction counts against the window's time too
+    remaining = max(0.0, time_limit - (time.time() - start_time))
+    tour, cost = iterated_local_search(sub, tour, remaining, rng=rng)
+
+    # a finite tour of the view always closes with the last -> first arc
+    if tour[-1] != m - 1:
+        return nodes
+    return [nodes[k] for k in tour]
+
+
+def _solve_window(nodes: list[int], time_limit: float, seed: Optional[int]) -> list[int]:
+    return solve_path(_worker_graph, nodes, time_limit, random.Random(seed))
+
+
+def decompose(
+    graph: AsymmetricGraph,
+    tour: list[int],
+    time_limit: float,
+    window: int = 200,
+    rounds: int = 2,
+    workers: Optional[int] = None,
+    seed: Optional[int] = None,
+    progress: Optional[Progress] = None,
+) -> tuple[list[int], float]:
+    """
+    Improves a tour by splitting it into windows of consecutive nodes and
+    re-optimizing every window in parallel
+    returns a tuple (tour, cost)
+    Each window keeps its first and last node, so improved windows are simply put
+    back in place. Every other round the windows are shifted by half a window, so the
+    nodes around the previous boundaries get re-optimized (POPMUSIC style).
+    Workers see each window through a SubGraph view of the graph. CoordinateGraph
+    and SparseGraph are sent to the workers as they are, other graphs are copied
+    once into shared memory as a dense n x n matrix (8 * n * n bytes).
+    time_limit: total time in seconds, split evenly between the rounds
+    workers: number of processes (None for one per CPU)
+    progress: called with (elapsed seconds, cost) after every round
+    """
+    n = len(tour)
+    if window < 4:
+        raise ValueError("window must be at least 4")
+    if rounds < 1:
+        raise ValueError("rounds must be at least 1")
+    start_time = time.time()
+    if n <= window:
+        tour, cost = iterated_local_search(graph, tour, time_limit, rng=random.Random(seed))
+        if progress is not None:
+            progress(time.time() - start_time, cost)
+        return tour, cost
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    start = tour[0]
+    rng = random.Random(seed)
+    shared = to_shared(graph)
+    try:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context(),
+            initializer=_init_worker,
+            initargs=(shared,),
+        ) as pool:
+            for r in range(rounds):
+                offset = (r % 2) * (window // 2)
+                rotated = tour[offset:] + tour[:offset]
+                windows = [rotated[k : k + window] for k in range(0, n, window)]
+                # windows run in parallel, so each gets its share of the round's wall time
+                budget = time_limit / rounds * min(workers, len(windows)) / len(windows)
+                seeds = [rng.randrange(2**32) for _ in windows]
+                solved = pool.map(_solve_window, windows, [budget] * len(windows), seeds)
+                tour = [node for nodes in solved for node in nodes]
+                if progress is not None:
+                    progress(time.time() - start_time, _tour_cost(graph, tour))
+    finally:
+        if shared is not graph:
+            shared.unlink()
+
+    idx = tour.index(start)
+    tour = tour[idx:] + tour[:idx]
+    return tour, _tour_cost(graph, tour)
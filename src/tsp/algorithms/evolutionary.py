@@ -0,0 +1,232 @@
+import multiprocessing
+import os
+import queue
+import random
+import time
+from typing import Callable, Optional
+
+from tsp.algorithms.constructive import _tour_cost
+from tsp.algorithms.local_search import _neighbor_lists, or_opt
+from tsp.models.graph import AsymmetricGraph
+from tsp.models.shared_graph import SharedMatrixGraph, to_shared
+
+type Progress = Callable[[float, float], None]
+
+
+def edge_recombination(
+    graph: AsymmetricGraph,
+    parent1: list[int],
+    parent2: list[int],
+    rng: random.Random,
+    candidates: Optional[list[list[int]]] = None,
+) -> list[int]:
+    """
+    Edge recombination crossover adapted to directed tours
+    Each node may be followed by its successor in either parent; arcs shared by both
+    parents are taken first, then the successor with the fewest unused successors
+    left. When no parent arc is usable the child continues through the cheapest
+    unused candidate, or a random unused node.
+    """
+    n = len(parent1)
+    succ1 = {parent1[i]: parent1[(i + 1) % n] for i in range(n)}
+    succ2 = {parent2[i]: parent2[(i + 1) % n] for i in range(n)}
+
+    unused = list(parent1)
+    where = {node: idx for idx, node in enumerate(unused)}
+
+    def take(node: int) -> None:
+        # O(1) removal from the unused pool
+        idx = where.pop(node)
+        last = unused.pop()
+        if last != node:
+            unused[idx] = last
+            where[last] = idx
+
+    def open_successors(node: int) -> int:
+        return sum(1 for s in (succ1[node], succ2[node]) if s in where)
+
+    current = parent1[0]
+    take(current)
+    child = [current]
+    while unused:
+        s1, s2 = succ1[current], succ2[current]
+        if s1 == s2 and s1 in where:
+            nxt = s1
+        else:
+            options = [s for s in (s1, s2) if s in where]
+            if options:
+                nxt = min(options, key=lambda s: (open_successors(s), graph.c(current, s), s))
+            else:
+                options = [s for s in candidates[current] if s in where] if candidates else []
+                nxt = options[0] if options else unused[rng.randrange(len(unused))]
+        take(nxt)
+        child.append(nxt)
+        current = nxt
+    return child
+
+
+def _double_bridge(tour: list[int], rng: random.Random, max_segment: int = 50) -> list[int]:
+    # swap two consecutive segments of at most max_segment nodes, nothing is
+    # reversed so the kicked tour stays close in cost for asymmetric graphs too
+    n = len(tour)
+    max_len = max(1, min(max_segment, (n - 2) // 2))
+    len1, len2 = rng.randint(1, max_len), rng.randint(1, max_len)
+    i = rng.randrange(n - len1 - len2 + 1)
+    j, k = i + len1, i + len1 + len2
+    return tour[:i] + tour[j:k] + tour[i:j] + tour[k:]
+
+
+def _island(
+    graph: AsymmetricGraph,
+    seed_tour: list[int],
+    island_id: int,
+    seed: Optional[int],
+    time_limit: float,
+    population_size: int,
+    migration_interval: int,
+    inbox,
+    outbox,
+    results,
+) -> None:
+    start_time = time.time()
+    rng = random.Random(None if seed is None else seed * 1000 + island_id)
+    # migrants left in the pipe at the end are not worth blocking exit for
+    outbox.cancel_join_thread()
+    candidates = _neighbor_lists(graph, 8)
+
+    # the population starts as kicked copies of the improved seed tour, which Or-opt
+    # repairs much faster than random tours; seeding stops at the deadline too
+    population = [or_opt(graph, list(seed_tour), candidates=candidates)]
+    while len(population) < population_size and time.time() - start_time < time_limit:
+        kicked = population[0][0]
+        for _ in range(3):
+            kicked = _double_bridge(kicked, rng)
+        population.append(or_opt(graph, kicked, candidates=candidates))
+    population.sort(key=lambda p: p[1])
+    best_cost = population[0][1]
+    results.put(("progress", time.time() - start_time, best_cost))
+
+    def tournament() -> list[int]:
+        return min(rng.sample(population, min(3, len(population))), key=lambda p: p[1])[0]
+
+    def insert(tour: list[int], cost: float) -> None:
+        # steady state: replace the worst individual, skip duplicates by cost
+        if cost < population[-1][1] and all(cost != c for _, c in population):
+            population[-1] = (tour, cost)
+            population.sort(key=lambda p: p[1])
+
+    generation = 0
+    while time.time() - start_time < time_limit:
+        generation += 1
+        child = edge_recombination(graph, tournament(), tournament(), rng, candidates)
+        insert(*or_opt(graph, child, candidates=candidates))
+
+        if generation % migration_interval == 0:
+            outbox.put(population[0])
+            while True:
+                try:
+                    insert(*inbox.get_nowait())
+                except queue.Empty:
+                    break
+
+        if population[0][1] < best_cost:
+            best_cost = population[0][1]
+            results.put(("progress", time.time() - start_time, best_cost))
+
+    results.put(("done", island_id, population[0][0], population[0][1]))
+    if isinstance(graph, SharedMatrixGraph):
+        graph.close()
+
+
+def island_model(
+    graph: AsymmetricGraph,
+    tour: list[int],
+    time_limit: float,
+    islands: Optional[int] = None,
+    population_size: int = 20,
+    migration_interval: int = 20,
+    seed: Optional[int] = None,
+    progress: Optional[Progress] = None,
+) -> tuple[list[int], float]:
+    """
+    Improves a tour using a parallel island-model evolutionary algorithm
+    returns a tuple (tour, cost)
+    Every island is a separate process running a steady-state population with
+    directed edge recombination and Or-opt on each offspring. Islands form a ring
+    and send their best tour to the next island every migration_interval generations.
+    CoordinateGraph and SparseGraph are sent to the islands as they are, other
+    graphs are put in shared memory once and attached by every island.
+    islands: number of processes (None for one per CPU)
+    time_limit: time in seconds each island runs, seeding its population included
+    progress: called with (elapsed seconds, best cost) whenever the best cost improves
+    """
+    n = len(tour)
+    if n < 5:
+        return tour, _tour_cost(graph, tour)
+    if islands is None:
+        islands = os.cpu_count() or 1
+    if islands < 1:
+        raise ValueError("islands must be at least 1")
+
+    start_time = time.time()
+    shared = to_shared(graph)
+    processes = []
+    try:
+        ctx = multiprocessing.get_context()
+        results = ctx.Queue()
+        mailboxes = [ctx.Queue() for _ in range(islands)]
+        for island_id in range(islands):
+            proc = ctx.Process(
+                target=_island,
+                args=(
+                    shared,
+                    tour,
+                    island_id,
+                    seed,
+                    time_limit,
+                    population_size,
+                    migration_interval,
+                    mailboxes[island_id],
+                    mailboxes[(island_id + 1) % islands],
+                    results,
+                ),
+                daemon=True,
+            )
+            proc.start()
+            processes.append(proc)
+
+        best_tour, best_cost = tour, _tour_cost(graph, tour)
+        done = 0
+        while done < islands:
+            try:
+                message = results.get(timeout=1.0)
+            except queue.Empty:
+                if any(proc.is_alive() for proc in processes):
+                    continue
+                # an island may have put its result and exited right after the timeout
+                try:
+                    message = results.get_nowait()
+                except queue.Empty:
+                    raise RuntimeError("island processes exited without a result")
+            if message[0] == "progress":
+                if message[2] < best_cost:
+                    best_cost = message[2]
+                    if progress is not None:
+                        progress(time.time() - start_time, best_cost)
+            else:
+                done += 1
+                if message[3] <= best_cost:
+                    best_tour, best_cost = message[2], message[3]
+
+        for proc in processes:
+            proc.join()
+    finally:
+        for proc in processes:
+            if proc.is_alive():
+                proc.terminate()
+        if shared is not graph:
+            shared.unlink()
+
+    idx = best_tour.index(tour[0])
+    best_tour = best_tour[idx:] + best_tour[:idx]
+    return best_tour, _tour_cost(graph, best_tour)
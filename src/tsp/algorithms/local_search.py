@@ -0,0 +1,290 @@
+import heapq
+import math
+import random
+import time
+from collections import deque
+from typing import Callable, Optional
+
+from tsp.algorithms.constructive import _EPS, _finite_arcs, _tour_cost
+from tsp.models.graph import AsymmetricGraph
+
+ACCEPT_CRITERIA = ("better", "better_or_equal", "always")
+
+
+def _neighbor_lists(graph: AsymmetricGraph, k: int) -> list[list[int]]:
+    # the k cheapest finite out-arcs of every node
+    neighbors = []
+    for i in range(graph.n):
+        nearest = heapq.nsmallest(k, _finite_arcs(graph, i), key=lambda arc: arc[1])
+        neighbors.append([j for j, _ in nearest])
+    return neighbors
+
+
+def _split_delta(
+    c: Callable[[int, int], float],
+    added: tuple[tuple[int, int], ...],
+    removed: tuple[tuple[int, int], ...],
+) -> tuple[int, float]:
+    # (change in missing arcs, change in finite cost) of a move, so that moves
+    # through missing arcs can still be compared
+    missing, total = 0, 0.0
+    for sign, arcs in ((1, added), (-1, removed)):
+        for i, j in arcs:
+            cost = c(i, j)
+            if cost == math.inf:
+                missing += sign
+            else:
+                total += sign * cost
+    return missing, total
+
+
+def _improves(missing: int, delta: float) -> bool:
+    return missing < 0 or (missing == 0 and delta < -_EPS)
+
+
+class _LinkedTour:
+    """
+    Tour as succ/pred arrays so that segment moves are O(1).
+    Every change is journaled so a rejected iteration can be undone.
+    """
+
+    def __init__(self, graph: AsymmetricGraph, tour: list[int]):
+        n = len(tour)
+        self.graph = graph
+        self.succ = [0] * graph.n
+        self.pred = [0] * graph.n
+        for idx, node in enumerate(tour):
+            self.succ[node] = tour[(idx + 1) % n]
+            self.pred[tour[(idx + 1) % n]] = node
+        self.journal: list[tuple[int, int, int]] = []
+
+    def to_list(self, start: int) -> list[int]:
+        tour = [start]
+        node = self.succ[start]
+        while node != start:
+            tour.append(node)
+            node = self.succ[node]
+        return tour
+
+    def _link(self, a: int, b: int) -> None:
+        self.journal.append((a, self.succ[a], self.pred[b]))
+        self.succ[a] = b
+        self.pred[b] = a
+
+    def rollback(self, mark: int) -> None:
+        while len(self.journal) > mark:
+            a, old_succ, old_pred_b = self.journal.pop()
+            b = self.succ[a]
+            self.succ[a] = old_succ
+            self.pred[b] = old_pred_b
+
+    def move_segment(self, s: int, e: int, r: int, q: int) -> None:
+        # cut s..e out and put it between r and q (r -> q is an arc of the tour)
+        p, nx = self.pred[s], self.succ[e]
+        self._link(p, nx)
+        self._link(r, s)
+        self._link(e, q)
+
+    def swap_segments(self, a: int, b_end: int, c_end: int) -> None:
+        # a -> [b .. b_end] -> [c .. c_end] -> d  becomes  a -> [c .. c_end] -> [b .. b_end] -> d
+        b, c, d = self.succ[a], self.succ[b_end], self.succ[c_end]
+        self._link(a, c)
+        self._link(c_end, b)
+        self._link(b_end, d)
+
+
+def _or_opt_descent(
+    linked: _LinkedTour,
+    neighbors: list[list[int]],
+    queue: deque,
+    queued: list[bool],
+    max_segment: int,
+    n: int,
+) -> tuple[int, float]:
+    """
+    Or-opt local search that only looks at segments starting at queued nodes
+    returns the total change as (missing arcs, finite cost)
+    """
+    c = linked.graph.c
+    succ, pred = linked.succ, linked.pred
+    total_missing, total = 0, 0.0
+    while queue:
+        s = queue.popleft()
+        queued[s] = False
+        moved = False
+        e = s
+        segment = [s]
+        for _ in range(min(max_segment, n - 3)):
+            p, nx = pred[s], succ[e]
+            removal = c(p, s) + c(e, nx) - c(p, nx)
+            for q in neighbors[e]:
+                r = pred[q]
+                if q == nx or q in segment or r in segment:
+                    continue
+                delta = c(r, s) + c(e, q) - c(r, q) - removal
+                # +inf only adds missing arcs, nan and -inf need the split delta
+                if delta >= -_EPS:
+                    continue
+                missing = 0
+                if not math.isfinite(delta):
+                    missing, delta = _split_delta(
+                        c, ((p, nx), (r, s), (e, q)), ((p, s), (e, nx), (r, q))
+                    )
+                    if not _improves(missing, delta):
+                        continue
+                linked.move_segment(s, e, r, q)
+                total_missing += missing
+                total += delta
+                for node in (p, nx, r, q, s, e):
+                    if not queued[node]:
+                        queued[node] = True
+                        queue.append(node)
+                moved = True
+                break
+            if moved:
+                break
+            e = succ[e]
+            segment.append(e)
+    return total_missing, total
+
+
+def or_opt(
+    graph: AsymmetricGraph,
+    tour: list[int],
+    neighbors: int = 8,
+    max_segment: int = 3,
+    candidates: Optional[list[list[int]]] = None,
+) -> tuple[list[int], float]:
+    """
+    Improves a tour by moving segments of up to max_segment nodes, without reversing them
+    returns a tuple (tour, cost)
+    Segments are only moved next to one of the neighbors cheapest out-arcs of their
+    last node, so each check costs O(neighbors) instead of O(n).
+    candidates: precomputed candidate lists to reuse across calls
+    """
+    n = len(tour)
+    if n < 5:
+        return tour, _tour_cost(graph, tour)
+
+    linked = _LinkedTour(graph, tour)
+    queued = [False] * graph.n
+    for node in tour:
+        queued[node] = True
+    if candidates is None:
+        candidates = _neighbor_lists(graph, neighbors)
+    _or_opt_descent(linked, candidates, deque(tour), queued, max_segment, n)
+
+    tour = linked.to_list(tour[0])
+    return tour, _tour_cost(graph, tour)
+
+
+def iterated_local_search(
+    graph: AsymmetricGraph,
+    tour: list[int],
+    time_limit: float,
+    accept: str = "better",
+    neighbors: int = 8,
+    max_segment: int = 3,
+    max_kick_segment: int = 50,
+    max_iterations: Optional[int] = None,
+    rng: Optional[random.Random] = None,
+    on_improvement: Optional[Callable[[list[int]], None]] = None,
+) -> tuple[list[int], float]:
+    """
+    Improves a tour using iterated local search
+    returns a tuple (tour, cost)
+    Each iteration applies a double-bridge kick (two consecutive segments of at most
+    max_kick_segment nodes swap places, nothing is reversed so it is valid for
+    asymmetric costs), then runs Or-opt only from the kick's endpoints.
+    Fewer missing arcs always counts as better, so tours through missing arcs
+    (e.g. from sparse_nearest_neighbor) get repaired instead of stuck at inf.
+    accept: "better" keeps strictly improving iterations, "better_or_equal" also keeps
+    ties and "always" keeps every iteration (the best tour seen is returned)
+    time_limit: time in seconds to run
+    max_iterations: maximum number of kicks (None for no limit)
+    on_improvement: called with the best tour every time it improves
+    """
+    if accept not in ACCEPT_CRITERIA:
+        raise ValueError(f"accept must be one of {ACCEPT_CRITERIA}")
+    if rng is None:
+        rng = random.Random()
+
+    n = len(tour)
+    if n < 8:
+        return or_opt(graph, tour, neighbors, max_segment)
+
+    start_time = time.time()
+    start = tour[0]
+    neighbor_lists = _neighbor_lists(graph, neighbors)
+    linked = _LinkedTour(graph, tour)
+    succ = linked.succ
+    c = graph.c
+
+    queued = [False] * graph.n
+    for node in tour:
+        queued[node] = True
+    _or_opt_descent(linked, neighbor_lists, deque(tour), queued, max_segment, n)
+    # costs are tracked as (missing arcs, finite cost) offsets from the first local
+    # optimum, so kicks that remove missing arcs are seen as improvements
+    current = best = (0, 0.0)
+    best_tour = linked.to_list(start)
+
+    max_len = min(max_kick_segment, (n - 2) // 2)
+    iterations = 0
+    while time.time() - start_time < time_limit and (
+        max_iterations is None or iterations < max_iterations
+    ):
+        iterations += 1
+        linked.journal.clear()
+
+        # walk two consecutive segments from a random node
+        a = rng.choice(tour)
+        b = succ[a]
+        b_end = b
+        for _ in range(rng.randint(1, max_len) - 1):
+            b_end = succ[b_end]
+        c_start = succ[b_end]
+        c_end = c_start
+        for _ in range(rng.randint(1, max_len) - 1):
+            c_end = succ[c_end]
+        d = succ[c_end]
+
+        delta = (
+            c(a, c_start) + c(c_end, b) + c(b_end, d)
+            - c(a, b) - c(b_end, c_start) - c(c_end, d)
+        )
+        missing = 0
+        if not math.isfinite(delta):
+            missing, delta = _split_delta(
+                c, ((a, c_start), (c_end, b), (b_end, d)), ((a, b), (b_end, c_start), (c_end, d))
+            )
+        linked.swap_segments(a, b_end, c_end)
+
+        queue = deque()
+        for node in (a, b, b_end, c_start, c_end, d):
+            if not queued[node]:
+                queued[node] = True
+                queue.append(node)
+        descent_missing, descent = _or_opt_descent(
+            linked, neighbor_lists, queue, queued, max_segment, n
+        )
+        missing += descent_missing
+        delta += descent
+
+        # even "always" does not walk into tours with more missing arcs
+        if missing > 0 or not (
+            accept == "always"
+            or _improves(missing, delta)
+            or (accept == "better_or_equal" and delta <= _EPS)
+        ):
+            linked.rollback(0)
+            continue
+
+        current = (current[0] + missing, current[1] + delta)
+        if _improves(current[0] - best[0], current[1] - best[1]):
+            best = current
+            best_tour = linked.to_list(start)
+            if on_improvement is not None:
+                on_improvement(best_tour)
+
+    return best_tour, _tour_cost(graph, best_tour)
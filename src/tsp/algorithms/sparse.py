@@ -0,0 +1,167 @@
+import math
+import time
+from typing import Callable, Optional
+
+from tsp.algorithms.constructive import _EPS, _tour_cost
+from tsp.models.sparse_graph import SparseGraph
+
+
+def _sorted_out_arcs(graph: SparseGraph, i: int) -> list[int]:
+    dests, costs = graph.out_arcs(i)
+    return [j for _, j in sorted(zip(costs, dests))]
+
+
+def sparse_nearest_neighbor(
+    graph: SparseGraph, start: int = 0, max_backtracks: int = 10000
+) -> tuple[list[int], float]:
+    """
+    Constructs a tour using the nearest neighbor algorithm over finite arcs only
+    returns a tuple (tour, cost)
+    When the greedy walk dead-ends (no finite arc to an unvisited node, or no finite
+    arc back to start) it backtracks and tries the next cheapest arc.
+    max_backtracks: after this many backtracks the remaining nodes are appended
+    greedily and the returned cost may be infinite
+    """
+    n = graph.n
+    if not (0 <= start < n):
+        raise IndexError("start must be a valid node index")
+
+    visited = [False] * n
+    visited[start] = True
+    tour: list[int] = [start]
+    # per tour position, the candidates not tried yet (cheapest last)
+    candidates = [_sorted_out_arcs(graph, start)[::-1]]
+    backtracks = 0
+
+    while backtracks <= max_backtracks:
+        if len(tour) == n:
+            if graph.c(tour[-1], start) != math.inf:
+                return tour, _tour_cost(graph, tour)
+            next_city = None
+        else:
+            next_city = None
+            pending = candidates[-1]
+            while pending:
+                j = pending.pop()
+                if not visited[j]:
+                    next_city = j
+                    break
+
+        if next_city is None:
+            # dead end: undo the last step and try its next candidate
+            if len(tour) == 1:
+                break
+            backtracks += 1
+            visited[tour.pop()] = False
+            candidates.pop()
+            continue
+
+        tour.append(next_city)
+        visited[next_city] = True
+        candidates.append(_sorted_out_arcs(graph, next_city)[::-1])
+
+    # no feasible tour found: finish greedily, through missing arcs if needed
+    unvisited = 0
+    while len(tour) < n:
+        next_city = None
+        for j in _sorted_out_arcs(graph, tour[-1]):
+            if not visited[j]:
+                next_city = j
+                break
+        if next_city is None:
+            while visited[unvisited]:
+                unvisited += 1
+            next_city = unvisited
+        tour.append(next_city)
+        visited[next_city] = True
+
+    return tour, _tour_cost(graph, tour)
+
+
+def _split(cost: float) -> tuple[int, float]:
+    # (number of missing arcs, finite cost) so that missing arcs can be compared
+    return (1, 0.0) if cost == math.inf else (0, cost)
+
+
+def _prefix_costs(graph: SparseGraph, tour: list[int]) -> tuple[list, list, list, list]:
+    # prefix sums along the tour of the forward arcs t[m] -> t[m + 1] and
+    # the backward arcs t[m + 1] -> t[m], kept as (missing count, finite cost)
+    n = len(tour)
+    fwd_inf, fwd = [0] * n, [0.0] * n
+    bwd_inf, bwd = [0] * n, [0.0] * n
+    for m in range(n - 1):
+        fi, fc = _split(graph.c(tour[m], tour[m + 1]))
+        bi, bc = _split(graph.c(tour[m + 1], tour[m]))
+        fwd_inf[m + 1] = fwd_inf[m] + fi
+        fwd[m + 1] = fwd[m] + fc
+        bwd_inf[m + 1] = bwd_inf[m] + bi
+        bwd[m + 1] = bwd[m] + bc
+    return fwd_inf, fwd, bwd_inf, bwd
+
+
+def sparse_two_opt(
+    graph: SparseGraph,
+    tour: list[int],
+    max_passes: int = 100,
+    timeout: float | None = None,
+    on_improvement: Optional[Callable[[list[int]], None]] = None,
+) -> tuple[list[int], float]:
+    """
+    Improves a tour using 2-opt moves whose new arc a -> c is a finite arc
+    returns a tuple (tour, cost)
+    The delta is exact for asymmetric costs (it includes the reversed segment) and
+    moves that reduce the number of missing arcs in the tour are always taken.
+    max_passes: maximum number of improvement passes to prevent infinite loops
+    timeout: maximum time in seconds to run (None for no limit)
+    on_improvement: called with the tour after every improving move
+    """
+    n = len(tour)
+    if n < 4:
+        return tour, _tour_cost(graph, tour)
+
+    improved = True
+    passes = 0
+    start_time = time.time()
+    while (
+        improved
+        and (timeout is None or time.time() - start_time < timeout)
+        and (timeout is not None or passes < max_passes)
+    ):
+        passes += 1
+        improved = False
+        pos = [0] * graph.n
+        for idx, node in enumerate(tour):
+            pos[node] = idx
+        fwd_inf, fwd, bwd_inf, bwd = _prefix_costs(graph, tour)
+
+        for i in range(n - 2):
+            a = tour[i]
+            b = tour[i + 1]
+            ab_inf, ab = _split(graph.c(a, b))
+            for c, ac in zip(*graph.out_arcs(a)):
+                j = pos[c]
+                if j <= i + 1:
+                    continue
+                d = tour[(j + 1) % n]
+                if d == a:
+                    continue
+                bd_inf, bd = _split(graph.c(b, d))
+                if bd_inf:
+                    continue
+                # reversing i+1..j turns the forward arcs inside the segment into backward ones
+                seg_bwd_inf = bwd_inf[j] - bwd_inf[i + 1]
+                if seg_bwd_inf:
+                    continue
+                cd_inf, cd = _split(graph.c(c, d))
+                delta_inf = -ab_inf - cd_inf - (fwd_inf[j] - fwd_inf[i + 1])
+                delta = ac + bd - ab - cd + (bwd[j] - bwd[i + 1]) - (fwd[j] - fwd[i + 1])
+                if delta_inf < 0 or (delta_inf == 0 and delta < -_EPS):
+                    tour[i + 1 : j + 1] = reversed(tour[i + 1 : j + 1])
+                    improved = True
+                    break
+            if improved:
+                if on_improvement is not None:
+                    on_improvement(tour)
+                break
+
+    return tour, _tour_cost(graph, tour)
@@ -0,0 +1,153 @@
+import time
+from typing import Callable, Optional
+
+from tsp.algorithms.constructive import _EPS, _tour_cost
+from tsp.models.symmetric_graph import SymmetricGraph
+
+
+def _edge_costs(graph: SymmetricGraph, tour: list[int]) -> list[float]:
+    n = len(tour)
+    return [graph.c(tour[k], tour[(k + 1) % n]) for k in range(n)]
+
+
+def _reconnect(tour: list[int], i: int, j: int, k: int, case: int) -> list[int]:
+    # new order of tour[i + 1 : k + 1] for the reconnection cases of three_opt_symmetric
+    s1 = tour[i + 1 : j + 1]
+    s2 = tour[j + 1 : k + 1]
+    if case == 0:
+        return s1[::-1] + s2
+    if case == 1:
+        return s1 + s2[::-1]
+    if case == 2:
+        return (s1 + s2)[::-1]
+    if case == 3:
+        return s1[::-1] + s2[::-1]
+    if case == 4:
+        return s2 + s1
+    if case == 5:
+        return s2 + s1[::-1]
+    return s2[::-1] + s1
+
+
+def two_opt_symmetric(
+    graph: SymmetricGraph,
+    tour: list[int],
+    max_passes: int = 100,
+    timeout: float | None = None,
+    on_improvement: Optional[Callable[[list[int]], None]] = None,
+) -> tuple[list[int], float]:
+    """
+    Improves a tour using the 2-opt algorithm on a symmetric graph
+    returns a tuple (tour, cost)
+    With symmetric costs reversing a segment does not change its internal cost,
+    so the boundary delta is exact and the scan continues after each move.
+    max_passes: maximum number of improvement passes to prevent infinite loops
+    timeout: maximum time in seconds to run (None for no limit)
+    on_improvement: called with the tour after every improving move
+    """
+    n = len(tour)
+    if n < 4:
+        return tour, _tour_cost(graph, tour)
+
+    improved = True
+    passes = 0
+    start_time = time.time()
+    while (
+        improved
+        and (timeout is None or time.time() - start_time < timeout)
+        and (timeout is not None or passes < max_passes)
+    ):
+        passes += 1
+        improved = False
+        edge = _edge_costs(graph, tour)
+        for i in range(n - 2):
+            row_a = graph.row(tour[i])
+            row_b = graph.row(tour[i + 1])
+            # the wrap-around edge shares node tour[0] with edge 0
+            for j in range(i + 2, n if i > 0 else n - 1):
+                c = tour[j]
+                d = tour[(j + 1) % n]
+                delta = row_a[c] + row_b[d] - edge[i] - edge[j]
+                if delta < -_EPS:
+                    tour[i + 1 : j + 1] = reversed(tour[i + 1 : j + 1])
+                    edge[i + 1 : j] = reversed(edge[i + 1 : j])
+                    edge[i] = row_a[c]
+                    edge[j] = row_b[d]
+                    row_b = graph.row(tour[i + 1])
+                    improved = True
+                    if on_improvement is not None:
+                        on_improvement(tour)
+            if timeout is not None and time.time() - start_time >= timeout:
+                break
+
+    return tour, _tour_cost(graph, tour)
+
+
+def three_opt_symmetric(
+    graph: SymmetricGraph,
+    tour: list[int],
+    max_passes: int = 100,
+    timeout: float | None = None,
+    on_improvement: Optional[Callable[[list[int]], None]] = None,
+) -> tuple[list[int], float]:
+    """
+    Improves a tour using the 3-opt algorithm on a symmetric graph
+    returns a tuple (tour, cost)
+    Tries all seven reconnections of the three removed edges a-b, c-d, e-f
+    with exact deltas, since reversed segments keep their internal cost.
+    max_passes: maximum number of improvement passes to prevent infinite loops
+    timeout: maximum time in seconds to run (None for no limit)
+    on_improvement: called with the tour after every improving move
+    """
+    n = len(tour)
+    if n < 6:
+        return tour, _tour_cost(graph, tour)
+
+    improved = True
+    passes = 0
+    start_time = time.time()
+    while (
+        improved
+        and (timeout is None or time.time() - start_time < timeout)
+        and passes < max_passes
+    ):
+        passes += 1
+        improved = False
+        edge = _edge_costs(graph, tour)
+        for i in range(n - 3):
+            a, b = tour[i], tour[i + 1]
+            row_a, row_b = graph.row(a), graph.row(b)
+            for j in range(i + 2, n - 1):
+                c, d = tour[j], tour[j + 1]
+                row_c, row_d = graph.row(c), graph.row(d)
+                for k in range(j + 2, n):
+                    e = tour[k]
+                    f = tour[(k + 1) % n]
+                    current = edge[i] + edge[j] + edge[k]
+                    candidates = (
+                        # 2-opt moves
+                        row_a[c] + row_b[d] + edge[k],
+                        edge[i] + row_c[e] + row_d[f],
+                        row_a[e] + row_b[f] + edge[j],
+                        # pure 3-opt moves
+                        row_a[c] + row_b[e] + row_d[f],
+                        row_a[d] + row_b[e] + row_c[f],
+                        row_a[d] + row_c[e] + row_b[f],
+                        row_a[e] + row_b[d] + row_c[f],
+                    )
+                    for case, new_cost in enumerate(candidates):
+                        if new_cost - current < -_EPS:
+                            tour[i + 1 : k + 1] = _reconnect(tour, i, j, k, case)
+                            improved = True
+                            break
+
+                    if improved:
+                        break
+                if improved:
+                    break
+            if improved:
+                if on_improvement is not None:
+                    on_improvement(tour)
+                break
+
+    return tour, _tour_cost(graph, tour)
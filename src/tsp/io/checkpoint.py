@@ -0,0 +1,136 @@
+import hashlib
+import json
+import os
+import random
+import struct
+import tempfile
+import time
+from array import array
+from typing import NamedTuple, Optional
+
+from tsp.models.graph import AsymmetricGraph
+
+MAGIC = b"TSPCKPT1"
+DEFAULT_INTERVAL = 5.0
+
+
+class Checkpoint(NamedTuple):
+    matrix_hash: str
+    phase: str
+    cost: float
+    tour: list[int]
+    rng_state: Optional[tuple] = None
+
+
+def graph_hash(graph: AsymmetricGraph, mode: str = "") -> str:
+    """
+    Hashes the parsed graph (its type, n, labels and stored costs) together with
+    mode, a description of how the input was loaded, so that reformatting the
+    input file does not invalidate a checkpoint but changing a cost does
+    The costs are read through graph.fingerprint(), in the graph's own storage.
+    """
+    digest = hashlib.sha256()
+    header = {
+        "mode": mode,
+        "type": type(graph).__name__,
+        "n": graph.n,
+        "labels": graph.labels,
+    }
+    digest.update(json.dumps(header).encode("utf-8"))
+    graph.fingerprint(digest)
+    return digest.hexdigest()
+
+
+def write_checkpoint(path: str, checkpoint: Checkpoint) -> None:
+    """
+    Writes a checkpoint atomically: a temporary file in the same directory is
+    written and synced, then renamed over path
+    Layout: MAGIC, header length (uint32), JSON header, tour as int32 values.
+    """
+    header = json.dumps(
+        {
+            "matrix_hash": checkpoint.matrix_hash,
+            "phase": checkpoint.phase,
+            "cost": checkpoint.cost,
+            "n": len(checkpoint.tour),
+            "rng_state": checkpoint.rng_state,
+        }
+    ).encode("utf-8")
+
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".checkpoint-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(MAGIC)
+            f.write(struct.pack("<I", len(header)))
+            f.write(header)
+            f.write(array("i", checkpoint.tour).tobytes())
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def read_checkpoint(path: str) -> Checkpoint:
+    with open(path, "rb") as f:
+        data = f.read()
+
+    if not data.startswith(MAGIC):
+        raise ValueError(f"{path} is not a checkpoint file")
+    offset = len(MAGIC)
+    (header_len,) = struct.unpack_from("<I", data, offset)
+    offset += 4
+    header = json.loads(data[offset : offset + header_len].decode("utf-8"))
+    offset += header_len
+
+    tour = array("i")
+    tour.frombytes(data[offset:])
+    if len(tour) != header["n"]:
+        raise ValueError(f"{path} is truncated")
+
+    rng_state = header["rng_state"]
+    if rng_state is not None:
+        # JSON turns the state tuples into lists
+        rng_state = (rng_state[0], tuple(rng_state[1]), rng_state[2])
+    return Checkpoint(
+        header["matrix_hash"], header["phase"], header["cost"], tour.tolist(), rng_state
+    )
+
+
+class Checkpointer:
+    """
+    Callable passed as on_improvement to the improvement functions: writes the
+    current tour at most every interval seconds, so calling it after every
+    improving move only costs a clock read.
+    Set phase before each improvement step; rng, when given, has its state saved too.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        graph: AsymmetricGraph,
+        matrix_hash: str,
+        interval: float = DEFAULT_INTERVAL,
+        rng: Optional[random.Random] = None,
+    ):
+        self.path = path
+        self.graph = graph
+        self.matrix_hash = matrix_hash
+        self.interval = interval
+        self.rng = rng
+        self.phase = ""
+        self._last_write = time.monotonic()
+
+    def __call__(self, tour: list[int]) -> None:
+        if time.monotonic() - self._last_write >= self.interval:
+            self.write(tour)
+
+    def write(self, tour: list[int]) -> None:
+        n = len(tour)
+        cost = sum(self.graph.c(tour[i], tour[(i + 1) % n]) for i in range(n))
+        rng_state = self.rng.getstate() if self.rng is not None else None
+        checkpoint = Checkpoint(self.matrix_hash, self.phase, cost, list(tour), rng_state)
+        write_checkpoint(self.path, checkpoint)
+        self._last_write = time.monotonic()
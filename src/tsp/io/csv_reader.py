@@ -1,16 +1,89 @@
 import csv
-from typing import Optional
+from typing import Iterator, Optional
 
+from tsp.models.coordinate_graph import DEFAULT_CACHE_SIZE, CoordinateGraph, CostFn
 from tsp.models.graph import AsymmetricGraph
+from tsp.models.sparse_graph import SparseGraph
+from tsp.models.symmetric_graph import DEFAULT_SYMMETRIC_TOL, NotSymmetricError, SymmetricGraph
 
 
 def read_asymetric_matrix(
     path: str,
     has_header: bool = True,
-    delimiter: str = ","
+    delimiter: str = ",",
+    symmetric_tol: Optional[float] = DEFAULT_SYMMETRIC_TOL,
 ) -> AsymmetricGraph:
+    """
+    Reads a cost matrix CSV; symmetric matrices (within symmetric_tol) are loaded
+    as a SymmetricGraph, set symmetric_tol=None to disable the detection
+    """
     rows, header = _read_csv_matrix_file(path, has_header, delimiter)
-    return _create_asymmetric_matrix(rows, header)
+    return _create_asymmetric_matrix(rows, header, symmetric_tol)
+
+
+def read_sparse_matrix(
+    path: str,
+    has_header: bool = True,
+    delimiter: str = ","
+) -> SparseGraph:
+    # rows are streamed into the CSR arrays, the dense matrix is never built
+    with open(path, newline="", encoding="utf-8") as f:
+        rows = (
+            row for row in csv.reader(f, delimiter=delimiter) if any(cell.strip() for cell in row)
+        )
+
+        header = next(rows, None) if has_header else None
+        if has_header and header is None:
+            raise ValueError("empty CSV")
+
+        labels: Optional[list[str]] = None
+        label_in_first_col = False
+        if header:
+            if len(header) < 2:
+                raise ValueError("header must have at least two cells")
+            if header[0].strip() in ["", "-"]:
+                label_in_first_col = True
+                header = header[1:]
+            labels = [h.strip() for h in header]
+
+        graph = SparseGraph(_strip_first_col(rows) if label_in_first_col else rows, labels)
+
+    if graph.n < 2:
+        raise ValueError("matrix must have at least two rows")
+    return graph
+
+
+def _strip_first_col(rows: Iterator[list[str]]) -> Iterator[list[str]]:
+    for r in rows:
+        yield r[1:]
+
+
+def read_points(
+    path: str,
+    has_header: Optional[bool] = None,
+    delimiter: str = ",",
+    cost_fn: Optional[CostFn] = None,
+    cache_size: int = DEFAULT_CACHE_SIZE,
+) -> CoordinateGraph:
+    """
+    Reads a points CSV (x,y or label,x,y per row)
+    has_header=None detects the header: the first row is a header when its
+    coordinate cells are not numbers
+    """
+    rows, _ = _read_csv_matrix_file(path, False, delimiter)
+    if has_header is None:
+        has_header = not _is_point_row(rows[0])
+    if has_header:
+        rows = rows[1:]
+    return _create_coordinate_graph(rows, cost_fn, cache_size)
+
+
+def _is_point_row(row: list[str]) -> bool:
+    try:
+        [float(cell) for cell in row[-2:]]
+    except ValueError:
+        return False
+    return True
 
 
 def _read_csv_matrix_file(
@@ -35,7 +108,8 @@ def _read_csv_matrix_file(
 
 def _create_asymmetric_matrix(
     rows: list[list[str]],
-    header: Optional[list[str]] = None
+    header: Optional[list[str]] = None,
+    symmetric_tol: Optional[float] = None,
 ) -> AsymmetricGraph:
     labels: Optional[list[str]] = None
 
@@ -64,4 +138,40 @@ def _create_asymmetric_matrix(
     if any(len(r) != n for r in rows):
         raise ValueError("each row must have the same number of cells as the header")
 
+    if symmetric_tol is not None:
+        # a single pass: packing stops at the first asymmetric pair
+        try:
+            return SymmetricGraph(rows, labels, tol=symmetric_tol)
+        except NotSymmetricError:
+            pass
     return AsymmetricGraph(rows, labels)
+
+
+def _create_coordinate_graph(
+    rows: list[list[str]],
+    cost_fn: Optional[CostFn] = None,
+    cache_size: int = DEFAULT_CACHE_SIZE,
+) -> CoordinateGraph:
+    # each row is either "x,y" or "label,x,y"
+    if len(rows) < 2:
+        raise ValueError("points file must have at least two points")
+
+    width = len(rows[0])
+    if width not in (2, 3):
+        raise ValueError("each row must be either x,y or label,x,y")
+    if any(len(r) != width for r in rows):
+        raise ValueError("each row must have the same number of cells")
+
+    labels: Optional[list[str]] = None
+    if width == 3:
+        labels = [r[0].strip() for r in rows]
+        rows = [r[1:] for r in rows]
+
+    points = []
+    for i, (x, y) in enumerate(rows):
+        try:
+            points.append((float(x), float(y)))
+        except ValueError:
+            raise ValueError(f"point {i} = ({x}, {y}) must be a pair of numbers")
+
+    return CoordinateGraph(points, labels, cost_fn=cost_fn, cache_size=cache_size)
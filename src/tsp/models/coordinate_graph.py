@@ -0,0 +1,136 @@
+from array import array
+from collections import OrderedDict
+from itertools import repeat
+from typing import Callable, List, Optional, Tuple
+import math
+
+from tsp.models.graph import AsymmetricGraph, Label
+
+type Point = Tuple[float, float]
+type CostFn = Callable[[float, float, float, float], float]
+
+DEFAULT_CACHE_SIZE = 1024
+
+
+class _RowCache:
+    """
+    LRU cache of cost rows computed on demand from node coordinates.
+    Indexing with a node returns its full outgoing row, like a dense matrix.
+    """
+
+    def __init__(self, xs: array, ys: array, cost_fn: Optional[CostFn], maxsize: int):
+        self._xs = xs
+        self._ys = ys
+        self._cost_fn = cost_fn
+        self._maxsize = maxsize
+        self._rows: OrderedDict[int, array] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    @property
+    def cost_fn(self) -> Optional[CostFn]:
+        return self._cost_fn
+
+    def __getstate__(self) -> dict:
+        # cached rows are not worth sending to another process
+        state = self.__dict__.copy()
+        state["_rows"] = OrderedDict()
+        return state
+
+    def __contains__(self, i: int) -> bool:
+        return i in self._rows
+
+    def __getitem__(self, i: int) -> array:
+        row = self._rows.get(i)
+        if row is not None:
+            self._rows.move_to_end(i)
+            return row
+
+        row = self._compute_row(i)
+        self._rows[i] = row
+        if len(self._rows) > self._maxsize:
+            self._rows.popitem(last=False)
+        return row
+
+    def cell(self, i: int, j: int) -> float:
+        # single cost: read from a cached row when there is one, otherwise computed
+        # directly so scalar lookups never build or evict rows
+        row = self._rows.get(i)
+        if row is not None:
+            return row[j]
+        if i == j:
+            return math.inf
+        xs, ys = self._xs, self._ys
+        if self._cost_fn is None:
+            return math.hypot(xs[j] - xs[i], ys[j] - ys[i])
+        return self._cost_fn(xs[i], ys[i], xs[j], ys[j])
+
+    def _compute_row(self, i: int) -> array:
+        xs, ys = self._xs, self._ys
+        xi, yi = xs[i], ys[i]
+        if self._cost_fn is None:
+            # whole-row pass over the coordinate arrays, no per-cell function dispatch
+            hypot = math.hypot
+            row = array("d", [hypot(xj - xi, yj - yi) for xj, yj in zip(xs, ys)])
+        else:
+            row = array("d", map(self._cost_fn, repeat(xi), repeat(yi), xs, ys))
+        row[i] = math.inf
+        return row
+
+
+class CoordinateGraph(AsymmetricGraph):
+    """
+    Graph whose costs are computed lazily from node coordinates.
+    cost_fn(xi, yi, xj, yj) gives the (possibly asymmetric) cost of the arc i -> j,
+    the default is the Euclidean distance.
+    row() keeps the cache_size most recently used rows in memory, c() computes
+    single costs without touching the cache.
+    """
+
+    def __init__(
+        self,
+        points: List[Point],
+        labels: Optional[List[str]] = None,
+        cost_fn: Optional[CostFn] = None,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+    ):
+        if not points:
+            raise ValueError("points cannot be empty")
+        if cache_size < 1:
+            raise ValueError("cache_size must be at least 1")
+
+        xs = array("d")
+        ys = array("d")
+        for i, point in enumerate(points):
+            try:
+                x, y = point
+                xs.append(float(x))
+                ys.append(float(y))
+            except (TypeError, ValueError):
+                raise ValueError(f"points[{i}] = {point} must be a pair of numbers")
+
+        self._n = len(points)
+        self._xs = xs
+        self._ys = ys
+        self._cost = _RowCache(xs, ys, cost_fn, cache_size)
+        self._set_labels(labels)
+
+    def c(self, i: Label, j: Label) -> float:
+        i, j = self._resolve(i, j)
+        return self._cost.cell(i, j)
+
+    def fingerprint(self, digest) -> None:
+        # the coordinates and the cost function define every cost
+        cost_fn = self._cost.cost_fn
+        if cost_fn is not None:
+            digest.update(f"{cost_fn.__module__}.{cost_fn.__qualname__}".encode("utf-8"))
+        digest.update(self._xs.tobytes())
+        digest.update(self._ys.tobytes())
+
+    @property
+    def cached_rows(self) -> int:
+        return len(self._cost)
+
+    def point(self, i: int) -> Point:
+        return self._xs[i], self._ys[i]
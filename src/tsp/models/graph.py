@@ -1,3 +1,4 @@
+from array import array
 from typing import List, Optional
 import math
 
@@ -6,6 +7,15 @@ EMPTY_VALS = ["", "inf", "NA"]
 type Label = str | int
 
 
+def _to_cost(val, i: int, j: int) -> float:
+    try:
+        if val is None or (isinstance(val, str) and val.strip() in EMPTY_VALS):
+            return math.inf
+        return float(val)
+    except ValueError:
+        raise ValueError(f"cost_matrix[{i}][{j}] = {val} must be a number")
+
+
 class AsymmetricGraph:
     def __init__(self, cost_matrix: List[List[float]], labels: Optional[List[str]] = None):
         if not cost_matrix:
@@ -24,18 +34,15 @@ class AsymmetricGraph:
                 if i == j:
                     new_row.append(math.inf)
                     continue
-                try:
-                    if val is None or (isinstance(val, str) and val.strip() in EMPTY_VALS):
-                        new_row.append(math.inf)
-                    else:
-                        new_row.append(float(val))
-                except ValueError:
-                    raise ValueError(f"cost_matrix[{i}][{j}] = {val} must be a number")
+                new_row.append(_to_cost(val, i, j))
             norm.append(new_row)
 
         self._cost = norm
         self._n = n
+        self._set_labels(labels)
 
+    def _set_labels(self, labels: Optional[List[str]]) -> None:
+        n = self._n
         if labels is not None:
             if len(set(labels)) != n:
                 raise ValueError("len(labels) must be equal to n and labels must be unique")
@@ -58,7 +65,27 @@ class AsymmetricGraph:
             raise ValueError(f"{label} is not in labels")
         return self._labels_map[label]
 
+    def row(self, i: int) -> List[float]:
+        """
+        Returns the outgoing costs of node i indexed by destination
+        """
+        if not (0 <= i < self._n):
+            raise IndexError(f"i must be between 0 and {self._n - 1}")
+        return self._cost[i]
+
     def c(self, i: Label, j: Label) -> float:
+        i, j = self._resolve(i, j)
+        return self._cost[i][j]
+
+    def fingerprint(self, digest) -> None:
+        """
+        Feeds the stored costs into digest (a hashlib object)
+        Subclasses hash their own storage so that no dense rows are built.
+        """
+        for i in range(self._n):
+            digest.update(array("d", self.row(i)).tobytes())
+
+    def _resolve(self, i: Label, j: Label) -> tuple[int, int]:
         try:
             if isinstance(i, str):
                 i = self._labels_map[i]
@@ -67,6 +94,6 @@ class AsymmetricGraph:
         except KeyError:
             raise ValueError(f"{i} or {j} is not in labels")
 
-        if not (0 <= i <= self._n and 0 <= j <= self._n):
+        if not (0 <= i < self._n and 0 <= j < self._n):
             raise IndexError(f"i and j must be between 0 and {self._n}")
-        return self._cost[i][j]
+        return i, j
@@ -0,0 +1,82 @@
+from array import array
+from multiprocessing import shared_memory
+from typing import List, Optional
+
+from tsp.models.coordinate_graph import CoordinateGraph
+from tsp.models.graph import AsymmetricGraph, Label
+from tsp.models.sparse_graph import SparseGraph
+
+
+class SharedMatrixGraph(AsymmetricGraph):
+    """
+    Dense cost matrix in a shared memory block (n * n doubles, row major).
+    Pickling only sends the block name, so worker processes attach to the
+    same memory instead of copying the matrix.
+    The creating process owns the block and must call unlink() when done.
+    """
+
+    def __init__(self, shm: shared_memory.SharedMemory, n: int, labels: Optional[List[str]] = None):
+        self._shm = shm
+        self._n = n
+        self._cost_buf = shm.buf.cast("d")
+        self._set_labels(labels)
+
+    @classmethod
+    def from_graph(cls, graph: AsymmetricGraph) -> "SharedMatrixGraph":
+        """
+        Copies every row of graph into a new block
+        The block holds the full dense matrix (8 * n * n bytes, about 3.2 GB for
+        20000 nodes), see to_shared() for graphs that should not be densified.
+        """
+        n = graph.n
+        shm = shared_memory.SharedMemory(create=True, size=max(n * n, 1) * 8)
+        shared = cls(shm, n, graph.labels)
+        for i in range(n):
+            shared._cost_buf[i * n : (i + 1) * n] = array("d", graph.row(i))
+        return shared
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    def __getstate__(self) -> dict:
+        return {"name": self._shm.name, "n": self._n, "labels": self._labels}
+
+    def __setstate__(self, state: dict) -> None:
+        shm = shared_memory.SharedMemory(name=state["name"])
+        self.__init__(shm, state["n"], state["labels"])
+
+    def row(self, i: int) -> List[float]:
+        if not (0 <= i < self._n):
+            raise IndexError(f"i must be between 0 and {self._n - 1}")
+        # a copy, views into the block would keep it from being closed
+        return self._cost_buf[i * self._n : (i + 1) * self._n].tolist()
+
+    def c(self, i: Label, j: Label) -> float:
+        i, j = self._resolve(i, j)
+        return self._cost_buf[i * self._n + j]
+
+    def fingerprint(self, digest) -> None:
+        digest.update(self._cost_buf)
+
+    def close(self) -> None:
+        self._cost_buf.release()
+        self._shm.close()
+
+    def unlink(self) -> None:
+        try:
+            self._shm.unlink()
+        finally:
+            self.close()
+
+
+def to_shared(graph: AsymmetricGraph) -> AsymmetricGraph:
+    """
+    Returns graph in a form that is cheap to send to worker processes
+    CoordinateGraph and SparseGraph are already compact and pickle as they are,
+    so they are returned unchanged, like a SharedMatrixGraph. Any other graph is
+    copied into a new SharedMatrixGraph, which the caller must unlink() when done.
+    """
+    if isinstance(graph, (SharedMatrixGraph, CoordinateGraph, SparseGraph)):
+        return graph
+    return SharedMatrixGraph.from_graph(graph)
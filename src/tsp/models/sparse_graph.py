@@ -0,0 +1,80 @@
+from array import array
+from bisect import bisect_left
+from typing import Iterable, List, Optional, Sequence
+import math
+
+from tsp.models.graph import AsymmetricGraph, Label, _to_cost
+
+
+class SparseGraph(AsymmetricGraph):
+    """
+    Graph that stores only finite arcs, in CSR layout:
+    the out-arcs of node i are indices[indptr[i]:indptr[i + 1]] (sorted by destination)
+    with the matching costs in costs[indptr[i]:indptr[i + 1]].
+    Missing arcs (EMPTY_VALS, inf) cost math.inf.
+    cost_matrix can be any iterable of rows, so it can be streamed from a file
+    without ever holding the dense matrix.
+    """
+
+    def __init__(self, cost_matrix: Iterable[Sequence], labels: Optional[List[str]] = None):
+        indptr = array("q", [0])
+        indices = array("i")
+        costs = array("d")
+
+        n = None
+        for i, row in enumerate(cost_matrix):
+            if n is None:
+                n = len(row)
+            if len(row) != n:
+                raise ValueError("cost_matrix must be a square matrix")
+            for j, val in enumerate(row):
+                if i == j:
+                    continue
+                cost = _to_cost(val, i, j)
+                if cost != math.inf:
+                    indices.append(j)
+                    costs.append(cost)
+            indptr.append(len(indices))
+
+        if n is None:
+            raise ValueError("cost_matrix cannot be empty")
+        if len(indptr) - 1 != n:
+            raise ValueError("cost_matrix must be a square matrix")
+
+        self._n = n
+        self._indptr = indptr
+        self._indices = indices
+        self._costs = costs
+        self._set_labels(labels)
+
+    @property
+    def arc_count(self) -> int:
+        return len(self._indices)
+
+    def out_arcs(self, i: int) -> tuple[array, array]:
+        """
+        Returns (destinations, costs) of the finite arcs leaving node i
+        """
+        lo, hi = self._indptr[i], self._indptr[i + 1]
+        return self._indices[lo:hi], self._costs[lo:hi]
+
+    def row(self, i: int) -> List[float]:
+        if not (0 <= i < self._n):
+            raise IndexError(f"i must be between 0 and {self._n - 1}")
+        row = [math.inf] * self._n
+        for j, cost in zip(*self.out_arcs(i)):
+            row[j] = cost
+        return row
+
+    def fingerprint(self, digest) -> None:
+        digest.update(self._indptr.tobytes())
+        digest.update(self._indices.tobytes())
+        digest.update(self._costs.tobytes())
+
+    def c(self, i: Label, j: Label) -> float:
+        i, j = self._resolve(i, j)
+        lo, hi = self._indptr[i], self._indptr[i + 1]
+        k = bisect_left(self._indices, j, lo, hi)
+        if k < hi and self._indices[k] == j:
+            return self._costs[k]
+        return math.inf
@@ -0,0 +1,57 @@
+from typing import List, Sequence
+import math
+
+from tsp.models.graph import AsymmetricGraph, Label
+
+
+class SubGraph(AsymmetricGraph):
+    """
+    View of some nodes of a parent graph, no costs are copied:
+    node k of the view is node nodes[k] of the parent.
+    With path=True the view models a path from nodes[0] to nodes[-1]: the arc from
+    the last node back to the first costs 0 and is the only arc leaving the last node
+    or entering the first one, so every finite tour of the view is such a path.
+    """
+
+    def __init__(self, parent: AsymmetricGraph, nodes: Sequence[int], path: bool = False):
+        if not nodes:
+            raise ValueError("nodes cannot be empty")
+        if len(set(nodes)) != len(nodes):
+            raise ValueError("nodes must be unique")
+        if any(not (0 <= v < parent.n) for v in nodes):
+            raise IndexError(f"nodes must be between 0 and {parent.n - 1}")
+
+        self._parent = parent
+        self._nodes = list(nodes)
+        self._path = path
+        self._n = len(self._nodes)
+        self._set_labels([parent.labels[v] for v in self._nodes])
+
+    @property
+    def nodes(self) -> List[int]:
+        return self._nodes
+
+    def row(self, i: int) -> List[float]:
+        if not (0 <= i < self._n):
+            raise IndexError(f"i must be between 0 and {self._n - 1}")
+        last = self._n - 1
+        if self._path and i == last:
+            row = [math.inf] * self._n
+            row[0] = 0.0
+            return row
+        # single costs, the parent row may be much longer than the view
+        c = self._parent.c
+        src = self._nodes[i]
+        row = [c(src, v) for v in self._nodes]
+        if self._path:
+            row[0] = math.inf
+        return row
+
+    def c(self, i: Label, j: Label) -> float:
+        i, j = self._resolve(i, j)
+        if self._path:
+            if i == self._n - 1:
+                return 0.0 if j == 0 else math.inf
+            if j == 0:
+                return math.inf
+        return self._parent.c(self._nodes[i], self._nodes[j])
@@ -0,0 +1,99 @@
+from array import array
+from typing import List, Optional, Sequence
+import math
+
+from tsp.models.graph import AsymmetricGraph, Label, _to_cost
+
+DEFAULT_SYMMETRIC_TOL = 1e-9
+
+
+class NotSymmetricError(ValueError):
+    """
+    Raised by SymmetricGraph when a pair of costs differs by more than tol
+    """
+
+
+def _costs_match(a: float, b: float, tol: float) -> bool:
+    if a == b:
+        return True
+    return abs(a - b) <= tol
+
+
+def is_symmetric(cost_matrix: Sequence[Sequence], tol: float = DEFAULT_SYMMETRIC_TOL) -> bool:
+    """
+    Checks whether c(i, j) and c(j, i) differ by at most tol for every pair
+    returns as soon as a mismatching pair is found
+    """
+    n = len(cost_matrix)
+    if any(len(row) != n for row in cost_matrix):
+        return False
+    for i in range(n):
+        row = cost_matrix[i]
+        for j in range(i + 1, n):
+            if not _costs_match(_to_cost(row[j], i, j), _to_cost(cost_matrix[j][i], j, i), tol):
+                return False
+    return True
+
+
+class SymmetricGraph(AsymmetricGraph):
+    """
+    Graph with c(i, j) == c(j, i), storing only the packed upper triangle
+    (n * (n - 1) / 2 costs). Pairs within tol of each other are averaged.
+    Raises NotSymmetricError at the first pair that differs, so callers can try
+    a SymmetricGraph and fall back without checking the matrix first.
+    """
+
+    def __init__(
+        self,
+        cost_matrix: Sequence[Sequence],
+        labels: Optional[List[str]] = None,
+        tol: float = DEFAULT_SYMMETRIC_TOL,
+    ):
+        if not cost_matrix:
+            raise ValueError("cost_matrix cannot be empty")
+        n = len(cost_matrix)
+        if any(len(row) != n for row in cost_matrix):
+            raise ValueError("cost_matrix must be a square matrix")
+
+        packed = array("d")
+        for i in range(n):
+            row = cost_matrix[i]
+            for j in range(i + 1, n):
+                upper = _to_cost(row[j], i, j)
+                lower = _to_cost(cost_matrix[j][i], j, i)
+                if not _costs_match(upper, lower, tol):
+                    raise NotSymmetricError(
+                        f"cost_matrix[{i}][{j}] and cost_matrix[{j}][{i}] differ"
+                    )
+                packed.append(upper if upper == lower else (upper + lower) / 2)
+
+        self._n = n
+        self._packed = packed
+        self._set_labels(labels)
+
+    def _offset(self, i: int) -> int:
+        # position of (i, i + 1) in the packed upper triangle
+        return i * (2 * self._n - i - 1) // 2
+
+    def row(self, i: int) -> List[float]:
+        if not (0 <= i < self._n):
+            raise IndexError(f"i must be between 0 and {self._n - 1}")
+        n = self._n
+        packed = self._packed
+        # column i above the diagonal, then row i after it
+        row = [packed[j * (2 * n - j - 1) // 2 + i - j - 1] for j in range(i)]
+        row.append(math.inf)
+        start = self._offset(i)
+        row.extend(packed[start : start + n - i - 1])
+        return row
+
+    def fingerprint(self, digest) -> None:
+        digest.update(self._packed.tobytes())
+
+    def c(self, i: Label, j: Label) -> float:
+        i, j = self._resolve(i, j)
+        if i == j:
+            return math.inf
+        if i > j:
+            i, j = j, i
+        return self._packed[self._offset(i) + j - i - 1]
@@ -0,0 +1,20 @@
+import random
+
+import pytest
+
+from tsp.models.graph import AsymmetricGraph
+
+
+@pytest.fixture
+def random_graph():
+    """
+    Factory for reproducible dense graphs with integer costs between 1 and 100
+    labels: when True the nodes are labeled N0, N1, ...
+    """
+
+    def make(n: int, seed: int = 0, labels: bool = False) -> AsymmetricGraph:
+        rnd = random.Random(seed)
+        matrix = [[rnd.randint(1, 100) for _ in range(n)] for _ in range(n)]
+        return AsymmetricGraph(matrix, labels=[f"N{i}" for i in range(n)] if labels else None)
+
+    return make
@@ -6,6 +6,9 @@ from tsp.models.graph import AsymmetricGraph
 from tsp.algorithms.constructive import (
     nearest_neighbor,
     cheapest_insertion,
+    greedy_edge,
+    nearest_insertion,
+    farthest_insertion,
 )
 
 
@@ -64,3 +67,44 @@ def test_cheapest_insertion_custom_start():
     _assert_valid_tour(g, tour, start=2)
     assert cost == pytest.approx(4.0)
     assert cost == pytest.approx(_tour_cost(g, tour))
+
+
+def test_greedy_edge_default_start():
+    g = _build_graph()
+    tour, cost = greedy_edge(g)
+    _assert_valid_tour(g, tour, start=0)
+    assert tour == [0, 1, 2, 3]
+    assert cost == pytest.approx(4.0)
+
+
+def test_greedy_edge_custom_start():
+    g = _build_graph()
+    tour, cost = greedy_edge(g, start=2)
+    _assert_valid_tour(g, tour, start=2)
+    assert cost == pytest.approx(4.0)
+    assert cost == pytest.approx(_tour_cost(g, tour))
+
+
+def test_greedy_edge_respects_degrees():
+    # 0->3 is cheaper than 1->2 but would give node 0 out-degree 2
+    m: List[List[float]] = [
+        [math.inf, 1, math.inf, 50],
+        [math.inf, math.inf, 60, math.inf],
+        [math.inf, math.inf, math.inf, 1],
+        [70, math.inf, math.inf, math.inf],
+    ]
+    g = AsymmetricGraph(m)
+    tour, cost = greedy_edge(g, start=1)
+    _assert_valid_tour(g, tour, start=1)
+    assert tour == [1, 2, 3, 0]
+    assert cost == pytest.approx(132.0)
+
+
+@pytest.mark.parametrize("algo", [nearest_insertion, farthest_insertion])
+def test_insertion_variants(algo):
+    g = _build_graph()
+    for start in range(4):
+        tour, cost = algo(g, start=start)
+        _assert_valid_tour(g, tour, start=start)
+        assert cost == pytest.approx(4.0)
+        assert cost == pytest.approx(_tour_cost(g, tour))
@@ -0,0 +1,143 @@
+import os
+import random
+import sys
+import tempfile
+
+import pytest
+
+import tsp
+from tsp.algorithms.constructive import two_opt
+from tsp.io.checkpoint import (
+    Checkpoint, Checkpointer, graph_hash, read_checkpoint, write_checkpoint
+)
+from tsp.io.csv_reader import read_asymetric_matrix
+from tsp.models.coordinate_graph import CoordinateGraph
+from tsp.models.graph import AsymmetricGraph
+from tsp.models.sparse_graph import SparseGraph
+from tsp.models.symmetric_graph import DEFAULT_SYMMETRIC_TOL, SymmetricGraph
+
+
+def _graph() -> AsymmetricGraph:
+    return AsymmetricGraph([
+        [float('inf'), 1, 10, 5],
+        [5, float('inf'), 1, 10],
+        [10, 5, float('inf'), 1],
+        [1, 10, 5, float('inf')],
+    ])
+
+
+def test_write_read_round_trip():
+    rng = random.Random(3)
+    checkpoint = Checkpoint("abc", "two_opt", 12.5, [3, 0, 2, 1], rng.getstate())
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "run.ckpt")
+        write_checkpoint(path, checkpoint)
+        loaded = read_checkpoint(path)
+        assert loaded == checkpoint
+        # no temporary files are left behind
+        assert os.listdir(tmp) == ["run.ckpt"]
+
+    restored = random.Random()
+    restored.setstate(loaded.rng_state)
+    assert restored.random() == rng.random()
+
+
+def test_read_invalid_file():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bad.ckpt")
+        with open(path, "wb") as f:
+            f.write(b"not a checkpoint")
+        with pytest.raises(ValueError, match="not a checkpoint"):
+            read_checkpoint(path)
+
+
+def test_checkpointer_throttles_writes():
+    g = _graph()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "run.ckpt")
+        checkpointer = Checkpointer(path, g, "abc", interval=3600)
+        checkpointer.phase = "two_opt"
+        checkpointer([0, 1, 2, 3])
+        assert not os.path.exists(path)
+        checkpointer.write([0, 1, 2, 3])
+        loaded = read_checkpoint(path)
+        assert loaded.phase == "two_opt"
+        assert loaded.cost == 4.0
+        assert loaded.rng_state is None
+
+
+def test_two_opt_reports_improvements():
+    g = _graph()
+    seen = []
+    two_opt(g, [0, 2, 1, 3], on_improvement=lambda tour: seen.append(list(tour)))
+    assert seen and all(sorted(t) == [0, 1, 2, 3] for t in seen)
+
+
+def _write_ring(path, far_cost="10"):
+    with open(path, "w") as f:
+        # ring A -> B -> ... -> F -> A costs 1, everything else costs far_cost
+        f.write("A,B,C,D,E,F\n")
+        for i in range(6):
+            f.write(",".join("1" if j == (i + 1) % 6 else far_cost for j in range(6)) + "\n")
+
+
+def test_graph_hash():
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = os.path.join(tmp, "m.csv")
+        _write_ring(csv_path)
+        h = graph_hash(read_asymetric_matrix(csv_path), "matrix")
+        _write_ring(csv_path, "10.0")
+        assert graph_hash(read_asymetric_matrix(csv_path), "matrix") == h
+        assert graph_hash(read_asymetric_matrix(csv_path), "sparse") != h
+        _write_ring(csv_path, "11")
+        assert graph_hash(read_asymetric_matrix(csv_path), "matrix") != h
+
+
+@pytest.mark.parametrize("graph_cls", [CoordinateGraph, SparseGraph, SymmetricGraph])
+def test_graph_hash_does_not_build_rows(graph_cls, monkeypatch):
+    def dense_row(self, i):
+        raise AssertionError("dense row built while hashing")
+
+    def make(d):
+        if graph_cls is CoordinateGraph:
+            return CoordinateGraph([(0, 0), (3, 4), (6, d)])
+        return graph_cls([[None, 1, d], [1, None, 2], [d, 2, None]])
+
+    monkeypatch.setattr(graph_cls, "row", dense_row)
+    h = graph_hash(make(5), "mode")
+    assert graph_hash(make(5), "mode") == h
+    assert graph_hash(make(7), "mode") != h
+
+
+def test_cli_resume(monkeypatch, capsys):
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = os.path.join(tmp, "m.csv")
+        _write_ring(csv_path)
+        graph = read_asymetric_matrix(csv_path)
+        matrix_hash = graph_hash(graph, f"matrix symmetric_tol={DEFAULT_SYMMETRIC_TOL}")
+        ckpt = os.path.join(tmp, "run.ckpt")
+        write_checkpoint(ckpt, Checkpoint(matrix_hash, "construct", 33.0, [0, 2, 1, 3, 4, 5]))
+
+        # the checkpointed tour is used instead of constructing a new one
+        monkeypatch.setattr(sys, "argv", ["tsp", csv_path, "--checkpoint", ckpt, "--resume"])
+        tsp.main()
+        out = capsys.readouterr().out
+        assert "Tour: ['A', 'C', 'B', 'D', 'E', 'F']" in out
+        assert "Cost: 33.0" in out
+
+        argv = ["tsp", csv_path, "--ils-time-limit", "0.1", "--checkpoint", ckpt, "--resume"]
+        monkeypatch.setattr(sys, "argv", argv)
+        tsp.main()
+        assert "Cost: 6.0" in capsys.readouterr().out
+        assert read_checkpoint(ckpt)[:3] == (matrix_hash, "ils", 6.0)
+
+        # a trailing blank line does not change the matrix
+        with open(csv_path, "a") as f:
+            f.write("\n")
+        tsp.main()
+        assert "Cost: 6.0" in capsys.readouterr().out
+
+        _write_ring(csv_path, "11")
+        with pytest.raises(SystemExit):
+            tsp.main()
+        assert "different input matrix" in capsys.readouterr().err
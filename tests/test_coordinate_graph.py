@@ -0,0 +1,139 @@
+import math
+import os
+import sys
+import tempfile
+
+import pytest
+
+import tsp
+from tsp.algorithms.constructive import nearest_neighbor, two_opt
+from tsp.io.csv_reader import read_points
+from tsp.models.coordinate_graph import CoordinateGraph
+from tsp.models.graph import AsymmetricGraph
+
+
+def _square() -> CoordinateGraph:
+    return CoordinateGraph([(0, 0), (3, 0), (3, 4), (0, 4)], labels=["A", "B", "C", "D"])
+
+
+def test_euclidean_costs():
+    g = _square()
+    assert isinstance(g, AsymmetricGraph)
+    assert g.n == 4
+    assert g.c(0, 1) == pytest.approx(3.0)
+    assert g.c(0, 2) == pytest.approx(5.0)
+    assert g.c("B", "A") == pytest.approx(3.0)
+    assert math.isinf(g.c(2, 2))
+
+
+def test_custom_asymmetric_cost_fn():
+    # going "up" costs twice as much as going "down"
+    def cost(xi, yi, xj, yj):
+        d = math.hypot(xj - xi, yj - yi)
+        return 2 * d if yj > yi else d
+
+    g = CoordinateGraph([(0, 0), (0, 1)], cost_fn=cost)
+    assert g.c(0, 1) == pytest.approx(2.0)
+    assert g.c(1, 0) == pytest.approx(1.0)
+    assert math.isinf(g.c(1, 1))
+
+
+def test_row_cache_is_bounded():
+    g = CoordinateGraph([(i, 0) for i in range(10)], cache_size=3)
+    for i in range(10):
+        g.row(i)
+    assert g.cached_rows == 3
+    # rows are recomputed after eviction with the same values
+    assert g.row(0)[5] == pytest.approx(5.0)
+
+
+def test_scalar_costs_do_not_fill_cache():
+    g = CoordinateGraph([(i, 0) for i in range(10)], cache_size=3)
+    assert g.c(0, 5) == pytest.approx(5.0)
+    assert math.isinf(g.c(4, 4))
+    assert g.cached_rows == 0
+    g.row(2)
+    assert g.cached_rows == 1
+    assert g.c(2, 7) == pytest.approx(5.0)
+
+
+def test_invalid_points():
+    with pytest.raises(ValueError):
+        CoordinateGraph([])
+    with pytest.raises(ValueError):
+        CoordinateGraph([(0, 0), ("x", 1)])
+    with pytest.raises(ValueError):
+        CoordinateGraph([(0, 0), (1, 1)], labels=["A"])
+
+
+def test_algorithms_accept_coordinate_graph():
+    g = _square()
+    tour, cost = nearest_neighbor(g)
+    assert sorted(tour) == [0, 1, 2, 3]
+    assert cost == pytest.approx(14.0)
+    tour, cost = two_opt(g, [0, 2, 1, 3])
+    assert cost == pytest.approx(14.0)
+
+
+def test_read_points_with_labels():
+    content = "label,x,y\nA,0,0\nB,3,0\nC,3,4\n"
+    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.csv') as f:
+        f.write(content)
+        temp_path = f.name
+    try:
+        g = read_points(temp_path)
+        assert g.labels == ["A", "B", "C"]
+        assert g.c("A", "C") == pytest.approx(5.0)
+    finally:
+        os.unlink(temp_path)
+
+
+def test_read_points_without_labels():
+    content = "0,0\n3,4\n"
+    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.csv') as f:
+        f.write(content)
+        temp_path = f.name
+    try:
+        g = read_points(temp_path, has_header=False)
+        assert g.labels == ["0", "1"]
+        assert g.c(0, 1) == pytest.approx(5.0)
+    finally:
+        os.unlink(temp_path)
+
+
+def test_read_points_invalid_width():
+    content = "x,y,z,w\n0,0,0,0\n1,1,1,1\n"
+    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.csv') as f:
+        f.write(content)
+        temp_path = f.name
+    try:
+        with pytest.raises(ValueError, match="label,x,y"):
+            read_points(temp_path)
+    finally:
+        os.unlink(temp_path)
+
+
+def test_read_points_detects_header():
+    for content, labels in [("x,y\n0,0\n3,4\n", ["0", "1"]), ("0,0\n3,4\n6,8\n", ["0", "1", "2"])]:
+        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.csv') as f:
+            f.write(content)
+            temp_path = f.name
+        try:
+            assert read_points(temp_path).labels == labels
+        finally:
+            os.unlink(temp_path)
+
+
+def test_cli_points_without_header(monkeypatch, capsys):
+    content = "0,0\n3,0\n3,4\n0,4\n"
+    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.csv') as f:
+        f.write(content)
+        temp_path = f.name
+    try:
+        monkeypatch.setattr(sys, "argv", ["tsp", temp_path, "--points"])
+        tsp.main()
+        out = capsys.readouterr().out
+        assert "Tour: ['0', '1', '2', '3']" in out
+        assert "Cost: 14.0" in out
+    finally:
+        os.unlink(temp_path)
@@ -0,0 +1,128 @@
+import math
+import pickle
+import random
+
+import pytest
+
+from tsp.algorithms.constructive import nearest_neighbor
+from tsp.algorithms.decomposition import decompose, solve_path
+from tsp.models.coordinate_graph import CoordinateGraph
+from tsp.models.graph import AsymmetricGraph
+from tsp.models.shared_graph import SharedMatrixGraph, to_shared
+from tsp.models.sparse_graph import SparseGraph
+from tsp.models.sub_graph import SubGraph
+
+
+def _tour_cost(g: AsymmetricGraph, tour: list[int]) -> float:
+    n = len(tour)
+    return sum(g.c(tour[i], tour[(i + 1) % n]) for i in range(n))
+
+
+def _path_cost(g: AsymmetricGraph, path: list[int]) -> float:
+    return sum(g.c(path[i], path[i + 1]) for i in range(len(path) - 1))
+
+
+def test_sub_graph_view(random_graph):
+    g = random_graph(6, labels=True)
+    sub = SubGraph(g, [4, 1, 3])
+    assert sub.n == 3
+    assert sub.labels == ["N4", "N1", "N3"]
+    assert sub.nodes == [4, 1, 3]
+    assert sub.c(0, 1) == g.c(4, 1)
+    assert sub.c(2, 0) == g.c(3, 4)
+    assert sub.row(1) == [g.c(1, 4), math.inf, g.c(1, 3)]
+
+
+def test_sub_graph_path_arcs(random_graph):
+    g = random_graph(6, labels=True)
+    sub = SubGraph(g, [4, 1, 3, 5], path=True)
+    assert sub.c(3, 0) == 0.0
+    assert math.isinf(sub.c(3, 1))
+    assert math.isinf(sub.c(1, 0))
+    assert sub.c(1, 2) == g.c(1, 3)
+    assert sub.row(3) == [0.0, math.inf, math.inf, math.inf]
+    assert math.isinf(sub.row(2)[0])
+
+
+def test_sub_graph_invalid_nodes(random_graph):
+    g = random_graph(4, labels=True)
+    with pytest.raises(ValueError):
+        SubGraph(g, [])
+    with pytest.raises(ValueError):
+        SubGraph(g, [1, 1])
+    with pytest.raises(IndexError):
+        SubGraph(g, [0, 4])
+
+
+def test_solve_path_keeps_ends(random_graph):
+    g = random_graph(20, seed=1, labels=True)
+    nodes = [3, 7, 1, 15, 0, 9, 12, 4, 18, 6]
+    path = solve_path(g, nodes, time_limit=0.2, rng=random.Random(0))
+    assert path[0] == 3 and path[-1] == 6
+    assert sorted(path) == sorted(nodes)
+    assert _path_cost(g, path) <= _path_cost(g, nodes)
+
+
+def test_decompose_improves_tour(random_graph):
+    g = random_graph(60, seed=2, labels=True)
+    tour, initial_cost = nearest_neighbor(g)
+    rounds = []
+    new_tour, cost = decompose(
+        g, tour, time_limit=1.0, window=20, workers=2, seed=1,
+        progress=lambda t, c: rounds.append(c),
+    )
+    assert sorted(new_tour) == list(range(60))
+    assert new_tour[0] == tour[0]
+    assert cost == pytest.approx(_tour_cost(g, new_tour))
+    assert cost <= initial_cost
+    assert len(rounds) == 2
+    assert rounds[-1] == pytest.approx(cost)
+
+
+def test_decompose_does_not_densify_coordinate_graph(monkeypatch):
+    def from_graph(cls, graph):
+        raise AssertionError("coordinate graph copied into a dense matrix")
+
+    monkeypatch.setattr(SharedMatrixGraph, "from_graph", classmethod(from_graph))
+    rnd = random.Random(5)
+    g = CoordinateGraph([(rnd.random(), rnd.random()) for _ in range(40)])
+    tour = list(range(40))
+    new_tour, cost = decompose(g, tour, time_limit=0.5, window=10, workers=2, seed=1)
+    assert sorted(new_tour) == tour
+    assert cost <= _tour_cost(g, tour) + 1e-9
+
+
+def test_to_shared():
+    coordinates = CoordinateGraph([(0, 0), (3, 4), (6, 8)])
+    coordinates.row(0)
+    sparse = SparseGraph([[None, 1, ""], ["", None, 1], [1, "", None]])
+    assert to_shared(coordinates) is coordinates
+    assert to_shared(sparse) is sparse
+    # cached rows stay behind when the graph is sent to a worker
+    assert pickle.loads(pickle.dumps(coordinates)).cached_rows == 0
+
+    dense = AsymmetricGraph([[0, 1, 2], [1, 0, 3], [2, 3, 0]])
+    shared = to_shared(dense)
+    try:
+        assert isinstance(shared, SharedMatrixGraph)
+        assert shared.row(2) == dense.row(2)
+    finally:
+        shared.unlink()
+
+
+def test_decompose_small_tour_reports_elapsed_time(random_graph):
+    g = random_graph(6, labels=True)
+    reports = []
+    tour, cost = decompose(
+        g, list(range(6)), time_limit=30.0, window=10,
+        progress=lambda t, c: reports.append((t, c)),
+    )
+    assert len(reports) == 1
+    assert reports[0][0] < 30.0
+    assert reports[0][1] == pytest.approx(cost)
+
+
+def test_decompose_invalid_window(random_graph):
+    g = random_graph(10, labels=True)
+    with pytest.raises(ValueError):
+        decompose(g, list(range(10)), time_limit=1.0, window=3)
@@ -0,0 +1,101 @@
+import multiprocessing
+import pickle
+import queue
+import random
+import time
+
+import pytest
+
+from tsp.algorithms.constructive import nearest_neighbor
+from tsp.algorithms.evolutionary import edge_recombination, island_model
+from tsp.models.graph import AsymmetricGraph
+from tsp.models.shared_graph import SharedMatrixGraph
+
+
+def _tour_cost(g: AsymmetricGraph, tour: list[int]) -> float:
+    n = len(tour)
+    return sum(g.c(tour[i], tour[(i + 1) % n]) for i in range(n))
+
+
+def test_shared_matrix_graph_round_trip(random_graph):
+    g = random_graph(6)
+    shared = SharedMatrixGraph.from_graph(g)
+    try:
+        attached = pickle.loads(pickle.dumps(shared))
+        assert attached.labels == g.labels
+        for i in range(6):
+            assert attached.row(i) == g.row(i)
+            for j in range(6):
+                assert attached.c(i, j) == g.c(i, j)
+        attached.close()
+    finally:
+        shared.unlink()
+
+
+def test_edge_recombination_keeps_common_arcs(random_graph):
+    g = random_graph(10)
+    parent1 = list(range(10))
+    parent2 = [0, 1, 2, 3, 9, 8, 7, 6, 5, 4]
+    child = edge_recombination(g, parent1, parent2, random.Random(0))
+    assert sorted(child) == list(range(10))
+    # 0 -> 1 -> 2 -> 3 is in both parents
+    assert child[:4] == [0, 1, 2, 3]
+
+
+def test_island_model_improves_tour(random_graph):
+    g = random_graph(30, seed=3)
+    tour, initial_cost = nearest_neighbor(g)
+    progress = []
+    best_tour, best_cost = island_model(
+        g, tour, time_limit=1.0, islands=2, seed=1, progress=lambda t, c: progress.append((t, c))
+    )
+    assert sorted(best_tour) == list(range(30))
+    assert best_tour[0] == tour[0]
+    assert best_cost == pytest.approx(_tour_cost(g, best_tour))
+    assert best_cost < initial_cost
+    assert progress and progress[-1][1] == best_cost
+    assert all(later[1] < earlier[1] for earlier, later in zip(progress, progress[1:]))
+
+
+def test_island_model_respects_time_limit(random_graph):
+    g = random_graph(800, seed=4)
+    start = time.time()
+    best_tour, _ = island_model(g, list(range(800)), time_limit=0.5, islands=1, seed=1)
+    assert time.time() - start < 1.5
+    assert sorted(best_tour) == list(range(800))
+
+
+def test_island_model_reads_results_of_exited_islands(random_graph, monkeypatch):
+    ctx = multiprocessing.get_context()
+    make_queue = ctx.Queue
+    queues = []
+
+    def late_queue(*args, **kwargs):
+        q = make_queue(*args, **kwargs)
+        if not queues:
+            # the results queue times out once, after every island has exited
+            get = q.get
+            timed_out = []
+
+            def late_get(block=True, timeout=None):
+                if timeout is not None and not timed_out:
+                    while multiprocessing.active_children():
+                        time.sleep(0.01)
+                    timed_out.append(True)
+                    raise queue.Empty
+                return get(block, timeout)
+
+            q.get = late_get
+        queues.append(q)
+        return q
+
+    monkeypatch.setattr(ctx, "Queue", late_queue)
+    g = random_graph(10)
+    best_tour, _ = island_model(g, list(range(10)), time_limit=0.2, islands=2, seed=1)
+    assert sorted(best_tour) == list(range(10))
+
+
+def test_island_model_invalid_islands(random_graph):
+    g = random_graph(10)
+    with pytest.raises(ValueError):
+        island_model(g, list(range(10)), time_limit=1.0, islands=0)
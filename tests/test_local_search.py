@@ -0,0 +1,79 @@
+import math
+import random
+
+import pytest
+
+from tsp.algorithms.constructive import nearest_neighbor
+from tsp.algorithms.local_search import iterated_local_search, or_opt
+from tsp.models.graph import AsymmetricGraph
+from tsp.models.sparse_graph import SparseGraph
+
+
+def _tour_cost(g: AsymmetricGraph, tour: list[int]) -> float:
+    n = len(tour)
+    return sum(g.c(tour[i], tour[(i + 1) % n]) for i in range(n))
+
+
+def test_or_opt_moves_misplaced_node():
+    # ring 0 -> 1 -> ... -> 5 -> 0 costs 1, everything else costs 10
+    n = 6
+    g = AsymmetricGraph([[1 if j == (i + 1) % n else 10 for j in range(n)] for i in range(n)])
+    tour, cost = or_opt(g, [0, 1, 3, 2, 4, 5])
+    assert tour == [0, 1, 2, 3, 4, 5]
+    assert cost == pytest.approx(6.0)
+
+
+def test_or_opt_never_worsens(random_graph):
+    g = random_graph(30)
+    initial, initial_cost = nearest_neighbor(g)
+    tour, cost = or_opt(g, initial.copy())
+    assert sorted(tour) == list(range(30))
+    assert tour[0] == initial[0]
+    assert cost <= initial_cost
+    assert cost == pytest.approx(_tour_cost(g, tour))
+
+
+@pytest.mark.parametrize("accept", ["better", "better_or_equal", "always"])
+def test_iterated_local_search(accept, random_graph):
+    g = random_graph(40, seed=1)
+    initial, _ = nearest_neighbor(g)
+    _, or_opt_cost = or_opt(g, initial.copy())
+    tour, cost = iterated_local_search(
+        g, initial.copy(), time_limit=10, accept=accept, max_iterations=300, rng=random.Random(0)
+    )
+    assert sorted(tour) == list(range(40))
+    assert tour[0] == initial[0]
+    assert cost == pytest.approx(_tour_cost(g, tour))
+    assert cost <= or_opt_cost
+
+
+@pytest.mark.parametrize("accept", ["better", "always"])
+def test_iterated_local_search_repairs_missing_arcs(accept):
+    # sparse ring 0 -> 1 -> ... -> 59 -> 0, the shuffled start misses almost every arc
+    n = 60
+    g = SparseGraph([[1 if j == (i + 1) % n else None for j in range(n)] for i in range(n)])
+    tour = list(range(n))
+    random.Random(0).shuffle(tour)
+    assert _tour_cost(g, tour) == math.inf
+    tour, cost = iterated_local_search(
+        g, tour, time_limit=10, accept=accept, max_iterations=2000, rng=random.Random(1)
+    )
+    assert cost == pytest.approx(60.0)
+
+
+def test_iterated_local_search_is_reproducible(random_graph):
+    g = random_graph(25, seed=2)
+    initial, _ = nearest_neighbor(g)
+    runs = [
+        iterated_local_search(
+            g, initial.copy(), time_limit=10, max_iterations=100, rng=random.Random(7)
+        )
+        for _ in range(2)
+    ]
+    assert runs[0] == runs[1]
+
+
+def test_iterated_local_search_invalid_accept(random_graph):
+    g = random_graph(10)
+    with pytest.raises(ValueError):
+        iterated_local_search(g, list(range(10)), time_limit=1, accept="sometimes")
@@ -0,0 +1,144 @@
+import math
+import os
+import random
+import tempfile
+
+import pytest
+
+from tsp.algorithms.constructive import greedy_edge, nearest_neighbor
+from tsp.algorithms.local_search import or_opt
+from tsp.algorithms.sparse import sparse_nearest_neighbor, sparse_two_opt
+from tsp.io.csv_reader import read_sparse_matrix
+from tsp.models.graph import AsymmetricGraph
+from tsp.models.sparse_graph import SparseGraph
+
+INF = math.inf
+
+
+def _tour_cost(g: AsymmetricGraph, tour: list[int]) -> float:
+    n = len(tour)
+    return sum(g.c(tour[i], tour[(i + 1) % n]) for i in range(n))
+
+
+def _trap_matrix() -> list[list]:
+    # the cheapest first step 0 -> 4 dead-ends (4 only goes back to 0),
+    # the only tour is 0 -> 1 -> 2 -> 3 -> 4 -> 0
+    return [
+        [None, 2, "", "inf", 1],
+        ["", None, 1, 9, ""],
+        ["", "", None, 1, ""],
+        ["", "", "", None, 1],
+        [1, "NA", "", "", None],
+    ]
+
+
+def test_sparse_graph_stores_finite_arcs_only():
+    g = SparseGraph(_trap_matrix(), labels=["A", "B", "C", "D", "E"])
+    assert isinstance(g, AsymmetricGraph)
+    assert g.n == 5
+    assert g.arc_count == 7
+    assert g.c(0, 1) == 2.0
+    assert g.c("B", "D") == 9.0
+    assert math.isinf(g.c(0, 2))
+    assert math.isinf(g.c(3, 3))
+    dests, costs = g.out_arcs(1)
+    assert list(dests) == [2, 3]
+    assert list(costs) == [1.0, 9.0]
+    assert g.row(0) == [INF, 2.0, INF, INF, 1.0]
+
+
+def test_sparse_graph_invalid():
+    with pytest.raises(ValueError):
+        SparseGraph([])
+    with pytest.raises(ValueError):
+        SparseGraph([[None, 1, 2], [3, None, 4]])
+    with pytest.raises(ValueError):
+        SparseGraph([[None, "abc"], [1, None]])
+    with pytest.raises(IndexError):
+        SparseGraph([[None, 1], [1, None]]).c(0, 2)
+
+
+def test_sparse_nearest_neighbor_backtracks_out_of_dead_end():
+    g = SparseGraph(_trap_matrix())
+    # the dense version walks into the dead end
+    _, dense_cost = nearest_neighbor(AsymmetricGraph(_trap_matrix()))
+    assert math.isinf(dense_cost)
+
+    tour, cost = sparse_nearest_neighbor(g)
+    assert tour == [0, 1, 2, 3, 4]
+    assert cost == pytest.approx(6.0)
+
+
+def test_sparse_nearest_neighbor_infeasible():
+    g = SparseGraph([[None, 1, ""], ["", None, 1], ["", "", None]])
+    tour, cost = sparse_nearest_neighbor(g)
+    assert sorted(tour) == [0, 1, 2]
+    assert math.isinf(cost)
+
+
+def test_sparse_graph_algorithms_use_out_arcs(monkeypatch):
+    def dense_row(self, i):
+        raise AssertionError("dense row built for a sparse graph")
+
+    monkeypatch.setattr(SparseGraph, "row", dense_row)
+    g = SparseGraph(_trap_matrix())
+    tour, cost = greedy_edge(g)
+    assert sorted(tour) == [0, 1, 2, 3, 4]
+    tour, cost = or_opt(g, tour)
+    assert sorted(tour) == [0, 1, 2, 3, 4]
+    infeasible = SparseGraph([[None, 1, ""], ["", None, 1], ["", "", None]])
+    tour, cost = sparse_nearest_neighbor(infeasible)
+    assert sorted(tour) == [0, 1, 2]
+
+
+def test_sparse_two_opt_improves():
+    m = [
+        [None, 1, 5, "", 1],
+        [5, None, 1, 5, ""],
+        ["", 5, None, 1, 5],
+        [5, "", 5, None, 1],
+        [1, 5, "", 5, None],
+    ]
+    g = SparseGraph(m)
+    tour, cost = sparse_two_opt(g, [0, 2, 1, 3, 4])
+    assert sorted(tour) == [0, 1, 2, 3, 4]
+    assert cost == pytest.approx(_tour_cost(g, tour))
+    assert cost < _tour_cost(g, [0, 2, 1, 3, 4])
+
+
+def test_sparse_two_opt_timeout_ignores_max_passes():
+    # symmetric random costs, so every improving 2-opt move is a finite one
+    rnd = random.Random(4)
+    n = 30
+    m = [[None] * n for _ in range(n)]
+    for i in range(n):
+        for j in range(i + 1, n):
+            m[i][j] = m[j][i] = rnd.randint(1, 100)
+    g = SparseGraph(m)
+    tour = list(range(n))
+    _, capped = sparse_two_opt(g, tour.copy(), max_passes=1)
+    _, timed = sparse_two_opt(g, tour.copy(), max_passes=1, timeout=5.0)
+    assert timed < capped
+
+
+def test_sparse_two_opt_keeps_optimal_tour():
+    g = SparseGraph(_trap_matrix())
+    tour, cost = sparse_two_opt(g, [0, 1, 2, 3, 4])
+    assert tour == [0, 1, 2, 3, 4]
+    assert cost == pytest.approx(6.0)
+
+
+def test_read_sparse_matrix():
+    content = ",A,B,C\nA,0,1,\nB,,0,2\nC,3,NA,0\n"
+    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.csv') as f:
+        f.write(content)
+        temp_path = f.name
+    try:
+        g = read_sparse_matrix(temp_path)
+        assert g.labels == ["A", "B", "C"]
+        assert g.arc_count == 3
+        assert g.c("A", "B") == 1.0
+        assert g.c("C", "A") == 3.0
+        assert math.isinf(g.c("B", "A"))
+    finally:
+        os.unlink(temp_path)
@@ -0,0 +1,123 @@
+import itertools
+import math
+import os
+import random
+import tempfile
+
+import pytest
+
+from tsp.algorithms.symmetric import three_opt_symmetric, two_opt_symmetric
+from tsp.io.csv_reader import read_asymetric_matrix
+from tsp.models.graph import AsymmetricGraph
+from tsp.models import symmetric_graph
+from tsp.models.symmetric_graph import NotSymmetricError, SymmetricGraph, is_symmetric
+
+
+def _tour_cost(g: AsymmetricGraph, tour: list[int]) -> float:
+    n = len(tour)
+    return sum(g.c(tour[i], tour[(i + 1) % n]) for i in range(n))
+
+
+def _random_symmetric(n: int, seed: int = 0) -> list[list[float]]:
+    rnd = random.Random(seed)
+    m = [[0.0] * n for _ in range(n)]
+    for i in range(n):
+        for j in range(i + 1, n):
+            m[i][j] = m[j][i] = float(rnd.randint(1, 100))
+    return m
+
+
+def test_is_symmetric():
+    assert is_symmetric([[0, 1], [1, 0]])
+    assert is_symmetric([[0, 1], [1.0000000001, 0]])
+    assert not is_symmetric([[0, 1], [2, 0]])
+    assert is_symmetric([[0, 1], [2, 0]], tol=1)
+    assert is_symmetric([[0, ""], ["inf", 0]])
+
+
+def test_symmetric_graph_matches_dense():
+    m = _random_symmetric(7)
+    dense = AsymmetricGraph(m)
+    g = SymmetricGraph(m)
+    assert isinstance(g, AsymmetricGraph)
+    for i, j in itertools.product(range(7), repeat=2):
+        assert g.c(i, j) == dense.c(i, j)
+    for i in range(7):
+        assert g.row(i) == dense.row(i)
+
+
+def test_symmetric_graph_rejects_asymmetric():
+    with pytest.raises(NotSymmetricError):
+        SymmetricGraph([[0, 1], [2, 0]])
+
+
+def test_symmetric_graph_averages_within_tolerance():
+    g = SymmetricGraph([[0, 1], [2, 0]], tol=1)
+    assert g.c(0, 1) == g.c(1, 0) == 1.5
+
+
+def test_reader_detects_symmetry():
+    content = "A,B,C\n0,1,2\n1,0,3\n2,3,0\n"
+    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.csv') as f:
+        f.write(content)
+        temp_path = f.name
+    try:
+        assert isinstance(read_asymetric_matrix(temp_path), SymmetricGraph)
+        assert not isinstance(read_asymetric_matrix(temp_path, symmetric_tol=None), SymmetricGraph)
+    finally:
+        os.unlink(temp_path)
+
+
+def test_reader_parses_symmetric_cells_once(monkeypatch):
+    parsed = []
+
+    def to_cost(val, i, j):
+        parsed.append((i, j))
+        return float(val)
+
+    monkeypatch.setattr(symmetric_graph, "_to_cost", to_cost)
+    content = "A,B,C\n0,1,2\n1,0,3\n2,3,0\n"
+    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.csv') as f:
+        f.write(content)
+        temp_path = f.name
+    try:
+        assert isinstance(read_asymetric_matrix(temp_path), SymmetricGraph)
+    finally:
+        os.unlink(temp_path)
+    assert sorted(parsed) == [(i, j) for i in range(3) for j in range(3) if i != j]
+
+
+def test_reader_keeps_asymmetric():
+    g = read_asymetric_matrix("samples/minimal_sample.csv")
+    assert not isinstance(g, SymmetricGraph)
+
+
+def test_two_opt_symmetric_improves():
+    g = SymmetricGraph(_random_symmetric(12, seed=1))
+    initial = list(range(12))
+    tour, cost = two_opt_symmetric(g, initial.copy())
+    assert sorted(tour) == initial
+    assert cost == pytest.approx(_tour_cost(g, tour))
+    assert cost < _tour_cost(g, initial)
+
+
+def test_three_opt_symmetric_finds_optimum_on_small_instance():
+    m = _random_symmetric(7, seed=2)
+    g = SymmetricGraph(m)
+    best = min(_tour_cost(g, [0, *p]) for p in itertools.permutations(range(1, 7)))
+    tour, cost = three_opt_symmetric(g, list(range(7)))
+    assert sorted(tour) == list(range(7))
+    assert cost == pytest.approx(_tour_cost(g, tour))
+    assert cost == pytest.approx(best)
+
+
+def test_symmetric_two_opt_with_missing_edges():
+    m = [
+        [0, 1, math.inf, 1],
+        [1, 0, 1, math.inf],
+        [math.inf, 1, 0, 1],
+        [1, math.inf, 1, 0],
+    ]
+    g = SymmetricGraph(m)
+    tour, cost = two_opt_symmetric(g, [0, 2, 1, 3])
+    assert cost == pytest.approx(4.0)